@@ -51,12 +51,13 @@ from .generator import (
     serialize_template,
 )
 from .merge import merge_pdfs
-from .split import split_pdf, parse_page_spec
-from .fill import fill_pdf_with_xfdf
+from .split import split_pdf, split_pdf_iter, split_pdf_path, parse_page_spec
+from .fill import fill_pdf_with_xfdf, fill_pdf_with_xfdf_path
 from .html import convert_html_to_pdf, convert_html_to_image
 from .redact import (
     get_page_info,
     extract_text_positions,
+    extract_text_positions_range,
     apply_redactions,
     find_text_occurrences,
     apply_redactions_advanced,
@@ -91,12 +92,16 @@ __all__ = [
     "get_available_fonts",
     "merge_pdfs",
     "split_pdf",
+    "split_pdf_iter",
+    "split_pdf_path",
     "parse_page_spec",
     "fill_pdf_with_xfdf",
+    "fill_pdf_with_xfdf_path",
     "convert_html_to_pdf",
     "convert_html_to_image",
     "get_page_info",
     "extract_text_positions",
+    "extract_text_positions_range",
     "apply_redactions",
     "find_text_occurrences",
     "apply_redactions_advanced",
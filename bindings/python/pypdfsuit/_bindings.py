@@ -6,8 +6,13 @@ This module handles loading the shared library and defining C function signature
 
 import ctypes
 from ctypes import c_char, c_char_p, c_int, c_void_p, POINTER, Structure, cast
+import mmap
 import platform
 import os
+import threading
+import weakref
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
 
 
@@ -45,6 +50,16 @@ class GoPDFSuitError(Exception):
 
 def _find_library() -> str:
     """Find the shared library for the current platform."""
+    # Wheels carry a _lib_path module generated by setup.py with the
+    # package-relative path of the bundled library, so installed copies skip
+    # platform detection and the filesystem probing below.
+    try:
+        from ._lib_path import LIB_PATH
+    except ImportError:
+        pass
+    else:
+        return str(Path(__file__).parent / LIB_PATH)
+
     system = platform.system()
     lib_dir = Path(__file__).parent / "lib"
 
@@ -81,84 +96,122 @@ def _find_library() -> str:
     return str(lib_path)
 
 
+# C signatures of the exported Go functions, declared once in one place:
+# name -> (argtypes, restype).
+_SIGNATURES = {
+    "GeneratePDF": ([c_char_p], ByteResult),
+    "MergePDFs": ([POINTER(c_char_p), POINTER(c_int), c_int], ByteResult),
+    "SplitPDF": ([c_char_p, c_int, c_char_p], ByteArrayResult),
+    "ParsePageSpec": ([c_char_p, c_int], ByteResult),
+    "FillPDFWithXFDF": ([c_char_p, c_int, c_char_p, c_int], ByteResult),
+    "ConvertHTMLToPDF": ([c_char_p], ByteResult),
+    "ConvertHTMLToImage": ([c_char_p], ByteResult),
+    "GetAvailableFonts": ([], ByteResult),
+    "GetPageInfo": ([c_char_p, c_int], ByteResult),
+    "ExtractTextPositions": ([c_char_p, c_int, c_int], ByteResult),
+    "FindTextOccurrences": ([c_char_p, c_int, c_char_p], ByteResult),
+    "ApplyRedactions": ([c_char_p, c_int, c_char_p], ByteResult),
+    "ApplyRedactionsAdvanced": ([c_char_p, c_int, c_char_p], ByteResult),
+    "FreeBytesResult": ([ByteResult], None),
+    "FreeBytesArrayResult": ([ByteArrayResult], None),
+}
+
+
 def _load_library():
-    """Load the shared library and configure function signatures."""
+    """
+    Load the shared library and configure function signatures.
+
+    Functions loaded through ctypes.CDLL release the GIL for the duration of
+    each foreign call, so long-running Go work (generation, splitting,
+    HTML rendering) runs in parallel with other Python threads, e.g. a
+    concurrent.futures.ThreadPoolExecutor batching documents.
+    """
     lib_path = _find_library()
     lib = ctypes.CDLL(lib_path)
 
-    # GeneratePDF
-    lib.GeneratePDF.argtypes = [c_char_p]
-    lib.GeneratePDF.restype = ByteResult
+    for name, (argtypes, restype) in _SIGNATURES.items():
+        func = getattr(lib, name)
+        func.argtypes = argtypes
+        func.restype = restype
 
-    # MergePDFs
-    lib.MergePDFs.argtypes = [POINTER(c_char_p), POINTER(c_int), c_int]
-    lib.MergePDFs.restype = ByteResult
+    return lib
 
-    # SplitPDF
-    lib.SplitPDF.argtypes = [c_char_p, c_int, c_char_p]
-    lib.SplitPDF.restype = ByteArrayResult
 
-    # ParsePageSpec
-    lib.ParsePageSpec.argtypes = [c_char_p, c_int]
-    lib.ParsePageSpec.restype = ByteResult
+# Lazy loading of the library
+_lib = None
+_lib_lock = threading.Lock()
 
-    # FillPDFWithXFDF
-    lib.FillPDFWithXFDF.argtypes = [c_char_p, c_int, c_char_p, c_int]
-    lib.FillPDFWithXFDF.restype = ByteResult
 
-    # ConvertHTMLToPDF
-    lib.ConvertHTMLToPDF.argtypes = [c_char_p]
-    lib.ConvertHTMLToPDF.restype = ByteResult
+def get_lib():
+    """Get the loaded library instance, loading it if necessary."""
+    global _lib
+    if _lib is None:
+        # Threads may race to the first call now that calls run without the
+        # GIL; make sure the library is loaded and configured only once.
+        with _lib_lock:
+            if _lib is None:
+                _lib = _load_library()
+    return _lib
 
-    # ConvertHTMLToImage
-    lib.ConvertHTMLToImage.argtypes = [c_char_p]
-    lib.ConvertHTMLToImage.restype = ByteResult
 
-    # GetAvailableFonts
-    lib.GetAvailableFonts.argtypes = []
-    lib.GetAvailableFonts.restype = ByteResult
+def lib_function(name: str):
+    """
+    Return a zero-argument accessor for a library function.
 
-    # GetPageInfo
-    lib.GetPageInfo.argtypes = [c_char_p, c_int]
-    lib.GetPageInfo.restype = ByteResult
+    The first call loads the library and resolves the symbol; later calls
+    return the cached function pointer straight from the lru_cache, so hot
+    entrypoints skip get_lib() and the attribute lookup on the CDLL.
 
-    # ExtractTextPositions
-    lib.ExtractTextPositions.argtypes = [c_char_p, c_int, c_int]
-    lib.ExtractTextPositions.restype = ByteResult
+    Example:
+        >>> _GeneratePDF = lib_function("GeneratePDF")
+        >>> call_bytes_result(_GeneratePDF(), payload)
+    """
 
-    # FindTextOccurrences
-    lib.FindTextOccurrences.argtypes = [c_char_p, c_int, c_char_p]
-    lib.FindTextOccurrences.restype = ByteResult
+    @lru_cache(maxsize=None)
+    def resolve():
+        return getattr(get_lib(), name)
 
-    # ApplyRedactions
-    lib.ApplyRedactions.argtypes = [c_char_p, c_int, c_char_p]
-    lib.ApplyRedactions.restype = ByteResult
+    return resolve
 
-    # ApplyRedactionsAdvanced
-    lib.ApplyRedactionsAdvanced.argtypes = [c_char_p, c_int, c_char_p]
-    lib.ApplyRedactionsAdvanced.restype = ByteResult
 
-    # FreeBytesResult
-    lib.FreeBytesResult.argtypes = [ByteResult]
-    lib.FreeBytesResult.restype = None
+_FreeBytesResult = lib_function("FreeBytesResult")
+_FreeBytesArrayResult = lib_function("FreeBytesArrayResult")
 
-    # FreeBytesArrayResult
-    lib.FreeBytesArrayResult.argtypes = [ByteArrayResult]
-    lib.FreeBytesArrayResult.restype = None
 
-    return lib
+@contextmanager
+def mapped_file(path):
+    """
+    Memory-map a file and yield a C pointer to its contents plus its length.
 
+    The file is mapped copy-on-write, so the OS pages it in on demand while
+    Go reads it and nothing is copied into Python memory up front. The
+    pointer is only valid inside the ``with`` block; the mapping is closed
+    on exit, so the C call must complete before then.
 
-# Lazy loading of the library
-_lib = None
+    Args:
+        path: Path of the file to map
 
+    Yields:
+        tuple[c_char_p, int]: Pointer to the mapped data and its length
 
-def get_lib():
-    """Get the loaded library instance, loading it if necessary."""
-    global _lib
-    if _lib is None:
-        _lib = _load_library()
-    return _lib
+    Raises:
+        ValueError: If the file is empty
+    """
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            raise ValueError(f"File is empty: {path}")
+        mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+
+    try:
+        # Take the address and drop the exported buffer straight away so the
+        # mapping can be closed once the caller is done with the pointer.
+        view = (c_char * size).from_buffer(mapping)
+        address = ctypes.addressof(view)
+        del view
+        yield c_char_p(address), size
+    finally:
+        mapping.close()
 
 
 def call_bytes_result(func, *args) -> bytes:
@@ -175,23 +228,47 @@ def call_bytes_result(func, *args) -> bytes:
     Raises:
         GoPDFSuitError: If the function returns an error
     """
-    lib = get_lib()
     result = func(*args)
 
     try:
-        if result.error:
-            error_msg = result.error.decode("utf-8")
-            raise GoPDFSuitError(error_msg)
-
-        if result.data is None or result.data == 0 or result.length <= 0:
+        # Each Structure field read builds a fresh Python object, so read
+        # every field exactly once.
+        error = result.error
+        if error:
+            raise GoPDFSuitError(error.decode("utf-8"))
+
+        data = result.data
+        length = result.length
+        if not data or length <= 0:
             return b""
 
-        # Cast void* to char* and read the exact number of bytes
+        # Read the exact number of bytes from the void* in a single copy.
         # This avoids null-termination issues with binary data
-        data = ctypes.string_at(result.data, result.length)
-        return data
+        return ctypes.string_at(data, length)
     finally:
-        lib.FreeBytesResult(result)
+        _FreeBytesResult()(result)
+
+
+def call_pdf_result(func, pdf_data: bytes, *extra) -> bytes:
+    """
+    Call a ByteResult function whose leading arguments are a PDF buffer and
+    its length.
+
+    The length is passed as a ready-made c_int, which ctypes forwards as-is
+    instead of converting a Python int through the argtypes dispatch.
+
+    Args:
+        func: The C function to call
+        pdf_data: The PDF content as bytes
+        *extra: Remaining arguments to pass after the PDF buffer and length
+
+    Returns:
+        bytes: The result data
+
+    Raises:
+        GoPDFSuitError: If the function returns an error
+    """
+    return call_bytes_result(func, pdf_data, c_int(len(pdf_data)), *extra)
 
 
 def call_bytes_array_result(func, *args) -> list:
@@ -208,26 +285,94 @@ def call_bytes_array_result(func, *args) -> list:
     Raises:
         GoPDFSuitError: If the function returns an error
     """
-    lib = get_lib()
     result = func(*args)
 
     try:
-        if result.error:
-            error_msg = result.error.decode("utf-8")
-            raise GoPDFSuitError(error_msg)
+        error = result.error
+        if error:
+            raise GoPDFSuitError(error.decode("utf-8"))
 
-        if result.count <= 0:
+        count = result.count
+        if count <= 0:
             return []
 
+        # Slicing a ctypes pointer converts the whole C array to a list in
+        # one call instead of indexing it element by element.
+        pointers = result.data[:count]
+        lengths = result.lengths[:count]
+
         # Copy all data before freeing
-        parts = []
-        for i in range(result.count):
-            length = result.lengths[i]
-            ptr = result.data[i]
+        string_at = ctypes.string_at
+        return [
+            string_at(ptr, length)
+            for ptr, length in zip(pointers, lengths)
+            if ptr and length > 0
+        ]
+    finally:
+        _FreeBytesArrayResult()(result)
+
+
+class _BytesArrayIterator:
+    """
+    Iterator over a ByteArrayResult that owns the Go-allocated result.
+
+    The result is freed when the iterator is exhausted or closed, or when it
+    is garbage collected, even if iteration never started.
+    """
+
+    __slots__ = ("_result", "_index", "_count", "_finalizer", "__weakref__")
+
+    def __init__(self, result, free):
+        self._result = result
+        self._index = 0
+        self._count = max(result.count, 0)
+        self._finalizer = weakref.finalize(self, free, result)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> bytes:
+        result = self._result
+        while self._finalizer.alive and self._index < self._count:
+            index = self._index
+            self._index = index + 1
+            ptr = result.data[index]
+            length = result.lengths[index]
             if ptr and length > 0:
-                data = ctypes.string_at(ptr, length)
-                parts.append(data)
+                return ctypes.string_at(ptr, length)
+        self.close()
+        raise StopIteration
 
-        return parts
-    finally:
-        lib.FreeBytesArrayResult(result)
+    def close(self) -> None:
+        """Free the Go-allocated result; further iteration stops."""
+        self._finalizer()
+
+
+def iter_bytes_array_result(func, *args):
+    """
+    Call a function that returns ByteArrayResult and yield its parts lazily.
+
+    The C function is called and its error checked immediately; each part is
+    then copied into Python only when the iterator reaches it, so at most one
+    part is held in Python memory at a time. The Go-allocated result is freed
+    when the iterator is exhausted, closed, or garbage collected.
+
+    Args:
+        func: The C function to call
+        *args: Arguments to pass to the function
+
+    Returns:
+        Iterator[bytes]: Iterator over the result byte arrays
+
+    Raises:
+        GoPDFSuitError: If the function returns an error
+    """
+    free = _FreeBytesArrayResult()
+    result = func(*args)
+
+    error = result.error
+    if error:
+        free(result)
+        raise GoPDFSuitError(error.decode("utf-8"))
+
+    return _BytesArrayIterator(result, free)
@@ -0,0 +1,45 @@
+"""
+JSON encoding and decoding for payloads exchanged with the Go library.
+
+orjson is used when it is installed (``pip install pypdfsuit[fast]``); it
+encodes straight to UTF-8 bytes and decodes from bytes without an
+intermediate str. The standard library json module is the fallback.
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+
+if orjson is not None:
+
+    # orjson rejects float subclasses (numpy.float64, for one) and non-str
+    # dict keys, both of which the json fallback accepts. Convert the former
+    # and allow the latter so both backends take the same inputs.
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+    def _orjson_default(obj):
+        if isinstance(obj, float):
+            return float(obj)
+        if isinstance(obj, int):
+            return int(obj)
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+    def dumps(obj) -> bytes:
+        """Serialize obj to compact UTF-8 JSON bytes."""
+        return orjson.dumps(obj, default=_orjson_default, option=_ORJSON_OPTIONS)
+
+    loads = orjson.loads
+
+else:
+
+    def dumps(obj) -> bytes:
+        """Serialize obj to compact UTF-8 JSON bytes."""
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode(
+            "utf-8"
+        )
+
+    loads = json.loads
@@ -2,7 +2,13 @@
 PDF form filling functionality.
 """
 
-from ._bindings import get_lib, call_bytes_result
+import os
+from ctypes import c_int
+from typing import Union
+
+from ._bindings import lib_function, call_bytes_result, call_pdf_result, mapped_file
+
+_FillPDFWithXFDF = lib_function("FillPDFWithXFDF")
 
 
 def fill_pdf_with_xfdf(pdf_data: bytes, xfdf_data: bytes) -> bytes:
@@ -38,12 +44,44 @@ def fill_pdf_with_xfdf(pdf_data: bytes, xfdf_data: bytes) -> bytes:
     if not xfdf_data:
         raise ValueError("XFDF data cannot be empty")
 
-    lib = get_lib()
-
-    return call_bytes_result(
-        lib.FillPDFWithXFDF,
+    return call_pdf_result(
+        _FillPDFWithXFDF(),
         pdf_data,
-        len(pdf_data),
         xfdf_data,
-        len(xfdf_data),
+        c_int(len(xfdf_data)),
     )
+
+
+def fill_pdf_with_xfdf_path(
+    pdf_path: Union[str, os.PathLike], xfdf_path: Union[str, os.PathLike]
+) -> bytes:
+    """
+    Fill a PDF form on disk with data from an XFDF file on disk.
+
+    Both files are memory-mapped and handed to Go directly, so large forms
+    are never read into Python memory.
+
+    Args:
+        pdf_path: Path to the PDF form
+        xfdf_path: Path to the XFDF data
+
+    Returns:
+        bytes: The filled PDF content
+
+    Raises:
+        GoPDFSuitError: If form filling fails
+        ValueError: If either file is empty
+
+    Example:
+        >>> from pypdfsuit import fill_pdf_with_xfdf_path
+        >>> filled = fill_pdf_with_xfdf_path("form.pdf", "data.xfdf")
+    """
+    with mapped_file(pdf_path) as (pdf_ptr, pdf_len):
+        with mapped_file(xfdf_path) as (xfdf_ptr, xfdf_len):
+            return call_bytes_result(
+                _FillPDFWithXFDF(),
+                pdf_ptr,
+                pdf_len,
+                xfdf_ptr,
+                xfdf_len,
+            )
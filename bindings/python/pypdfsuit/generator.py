@@ -2,20 +2,25 @@
 PDF generation functionality.
 """
 
-import json
-from typing import List
+from functools import lru_cache
+from operator import itemgetter
+from typing import List, Tuple
 
+from . import _json
 from .types import PDFTemplate, FontInfo
-from ._bindings import get_lib, call_bytes_result
+from ._bindings import lib_function, call_bytes_result
+
+_GeneratePDF = lib_function("GeneratePDF")
+_GetAvailableFonts = lib_function("GetAvailableFonts")
+
+# JSON keys of a font entry, in FontInfo field order.
+_FONT_KEYS = ("id", "name", "displayName", "reference")
+_font_fields = itemgetter(*_FONT_KEYS)
 
 
 def serialize_template(template: PDFTemplate) -> bytes:
     """Serialize a template to fresh UTF-8 JSON bytes for GeneratePDF."""
-    return json.dumps(
-        template.to_dict(),
-        ensure_ascii=False,
-        separators=(",", ":"),
-    ).encode("utf-8")
+    return template.to_json_bytes()
 
 
 def generate_pdf(template: PDFTemplate) -> bytes:
@@ -42,31 +47,39 @@ def generate_pdf(template: PDFTemplate) -> bytes:
         >>> with open("output.pdf", "wb") as f:
         ...     f.write(pdf_bytes)
     """
-    lib = get_lib()
     payload = serialize_template(template)
-    return call_bytes_result(lib.GeneratePDF, payload)
+    return call_bytes_result(_GeneratePDF(), payload)
 
 
 def get_available_fonts() -> List[FontInfo]:
     """
     Get the list of available fonts for PDF generation.
 
+    The font list is fixed for a given library build, so it is fetched from
+    Go once per process and served from a cache afterwards.
+
     Returns:
         List[FontInfo]: List of available fonts
 
     Raises:
         GoPDFSuitError: If getting fonts fails
     """
-    lib = get_lib()
-    data = call_bytes_result(lib.GetAvailableFonts)
-    fonts_data = json.loads(data.decode("utf-8"))
-
-    return [
-        FontInfo(
-            id=f.get("id", ""),
-            name=f.get("name", ""),
-            display_name=f.get("displayName", ""),
-            reference=f.get("reference", ""),
-        )
-        for f in fonts_data
-    ]
+    return list(_load_available_fonts())
+
+
+@lru_cache(maxsize=1)
+def _load_available_fonts() -> Tuple[FontInfo, ...]:
+    data = call_bytes_result(_GetAvailableFonts())
+    fonts_data = _json.loads(data)
+
+    fonts = []
+    for f in fonts_data:
+        # Go emits every key, so a single itemgetter call normally fetches
+        # all four fields; fall back to defaults for incomplete entries.
+        try:
+            values = _font_fields(f)
+        except KeyError:
+            values = [f.get(key, "") for key in _FONT_KEYS]
+        fonts.append(FontInfo(*values))
+
+    return tuple(fonts)
@@ -4,10 +4,12 @@ HTML to PDF/Image conversion functionality.
 Note: These functions require Chrome/Chromium to be available on the system.
 """
 
-import json
-
+from . import _json
 from .types import HtmlToPDFRequest, HtmlToImageRequest
-from ._bindings import get_lib, call_bytes_result
+from ._bindings import lib_function, call_bytes_result
+
+_ConvertHTMLToPDF = lib_function("ConvertHTMLToPDF")
+_ConvertHTMLToImage = lib_function("ConvertHTMLToImage")
 
 
 def convert_html_to_pdf(request: HtmlToPDFRequest) -> bytes:
@@ -45,10 +47,9 @@ def convert_html_to_pdf(request: HtmlToPDFRequest) -> bytes:
     if not request.html and not request.url:
         raise ValueError("Either html or url must be provided")
 
-    lib = get_lib()
-    request_json = json.dumps(request.to_dict()).encode("utf-8")
+    request_json = _json.dumps(request.to_dict())
 
-    return call_bytes_result(lib.ConvertHTMLToPDF, request_json)
+    return call_bytes_result(_ConvertHTMLToPDF(), request_json)
 
 
 def convert_html_to_image(request: HtmlToImageRequest) -> bytes:
@@ -83,7 +84,6 @@ def convert_html_to_image(request: HtmlToImageRequest) -> bytes:
     if not request.html and not request.url:
         raise ValueError("Either html or url must be provided")
 
-    lib = get_lib()
-    request_json = json.dumps(request.to_dict()).encode("utf-8")
+    request_json = _json.dumps(request.to_dict())
 
-    return call_bytes_result(lib.ConvertHTMLToImage, request_json)
+    return call_bytes_result(_ConvertHTMLToImage(), request_json)
@@ -2,11 +2,12 @@
 PDF merging functionality.
 """
 
-import ctypes
-from ctypes import c_char_p, c_int, POINTER
+from ctypes import c_char_p, c_int
 from typing import List
 
-from ._bindings import get_lib, call_bytes_result
+from ._bindings import lib_function, call_bytes_result
+
+_MergePDFs = lib_function("MergePDFs")
 
 
 def merge_pdfs(pdf_files: List[bytes]) -> bytes:
@@ -33,20 +34,17 @@ def merge_pdfs(pdf_files: List[bytes]) -> bytes:
     if not pdf_files:
         raise ValueError("At least one PDF file is required")
 
-    lib = get_lib()
-
-    # Create C arrays
+    # Create C arrays in a single constructor call each. A c_char_p slot
+    # points straight at the bytes object's internal buffer and the array
+    # keeps a reference to it for the call. ctypes arrays are accepted
+    # directly for POINTER argtypes, so no cast is needed.
     count = len(pdf_files)
-    pdf_data_array = (c_char_p * count)()
-    pdf_lengths_array = (c_int * count)()
-
-    for i, pdf in enumerate(pdf_files):
-        pdf_data_array[i] = ctypes.create_string_buffer(pdf).raw
-        pdf_lengths_array[i] = len(pdf)
+    pdf_data_array = (c_char_p * count)(*pdf_files)
+    pdf_lengths_array = (c_int * count)(*map(len, pdf_files))
 
     return call_bytes_result(
-        lib.MergePDFs,
-        ctypes.cast(pdf_data_array, POINTER(c_char_p)),
-        ctypes.cast(pdf_lengths_array, POINTER(c_int)),
+        _MergePDFs(),
+        pdf_data_array,
+        pdf_lengths_array,
         count,
     )
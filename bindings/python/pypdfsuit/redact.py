@@ -2,8 +2,69 @@
 PDF Redaction functionality.
 """
 
-import json
-from ._bindings import get_lib, call_bytes_result
+import hashlib
+import threading
+from collections import OrderedDict
+from ctypes import c_int
+
+from . import _json
+from ._bindings import lib_function, call_bytes_result, call_pdf_result
+
+_GetPageInfo = lib_function("GetPageInfo")
+_ExtractTextPositions = lib_function("ExtractTextPositions")
+_ApplyRedactions = lib_function("ApplyRedactions")
+_FindTextOccurrences = lib_function("FindTextOccurrences")
+_ApplyRedactionsAdvanced = lib_function("ApplyRedactionsAdvanced")
+
+# Raw JSON results of the read-only queries, keyed by (function, content
+# digest of the PDF, extra arguments). Redaction workflows query the same
+# document many times; a hit skips handing the PDF to Go to be re-parsed.
+# Bytes are cached rather than decoded objects so callers can mutate what
+# they get back. The cache is bounded by the total size of the cached
+# results; a single result larger than the whole budget is not cached.
+_RESULT_CACHE_MAX_BYTES = 16 * 1024 * 1024
+_result_cache = OrderedDict()
+_result_cache_bytes = 0
+_result_cache_lock = threading.Lock()
+
+def _pdf_digest(pdf_data: bytes) -> bytes:
+    return hashlib.blake2b(pdf_data, digest_size=16).digest()
+
+def _cached_call(accessor, digest: bytes, pdf_args: tuple, *extra) -> bytes:
+    global _result_cache_bytes
+
+    key = (accessor, digest) + extra
+    with _result_cache_lock:
+        data = _result_cache.get(key)
+        if data is not None:
+            _result_cache.move_to_end(key)
+            return data
+
+    data = call_bytes_result(accessor(), *pdf_args, *extra)
+    size = len(data)
+    if size > _RESULT_CACHE_MAX_BYTES:
+        return data
+
+    with _result_cache_lock:
+        previous = _result_cache.pop(key, None)
+        if previous is not None:
+            _result_cache_bytes -= len(previous)
+        _result_cache[key] = data
+        _result_cache_bytes += size
+        while _result_cache_bytes > _RESULT_CACHE_MAX_BYTES:
+            _, evicted = _result_cache.popitem(last=False)
+            _result_cache_bytes -= len(evicted)
+    return data
+
+def _clear_result_cache() -> None:
+    global _result_cache_bytes
+
+    with _result_cache_lock:
+        _result_cache.clear()
+        _result_cache_bytes = 0
+
+def _pdf_args(pdf_data: bytes) -> tuple:
+    return (pdf_data, c_int(len(pdf_data)))
 
 def get_page_info(pdf_data: bytes) -> dict:
     """
@@ -18,14 +79,11 @@ def get_page_info(pdf_data: bytes) -> dict:
     if not pdf_data:
         raise ValueError("PDF data cannot be empty")
 
-    lib = get_lib()
-    result_bytes = call_bytes_result(
-        lib.GetPageInfo,
-        pdf_data,
-        len(pdf_data)
+    result_bytes = _cached_call(
+        _GetPageInfo, _pdf_digest(pdf_data), _pdf_args(pdf_data)
     )
     
-    return json.loads(result_bytes)
+    return _json.loads(result_bytes)
 
 def extract_text_positions(pdf_data: bytes, page_num: int) -> list:
     """
@@ -41,15 +99,43 @@ def extract_text_positions(pdf_data: bytes, page_num: int) -> list:
     if not pdf_data:
         raise ValueError("PDF data cannot be empty")
 
-    lib = get_lib()
-    result_bytes = call_bytes_result(
-        lib.ExtractTextPositions,
-        pdf_data,
-        len(pdf_data),
-        page_num
+    result_bytes = _cached_call(
+        _ExtractTextPositions, _pdf_digest(pdf_data), _pdf_args(pdf_data), page_num
     )
     
-    return json.loads(result_bytes)
+    return _json.loads(result_bytes)
+
+def extract_text_positions_range(
+    pdf_data: bytes, start_page: int, end_page: int
+) -> list[list]:
+    """
+    Extract text positions for every page in an inclusive page range.
+
+    This is a convenience wrapper around extract_text_positions: Go is
+    still called once per page, and pages already extracted from the same
+    PDF are served from the result cache.
+
+    Args:
+        pdf_data: The PDF content as bytes
+        start_page: First page number (1-based)
+        end_page: Last page number (1-based, inclusive)
+
+    Returns:
+        list[list]: One list of text positions per page, in page order
+    """
+    if not pdf_data:
+        raise ValueError("PDF data cannot be empty")
+    if start_page < 1 or end_page < start_page:
+        raise ValueError(f"Invalid page range: {start_page}-{end_page}")
+
+    digest = _pdf_digest(pdf_data)
+    pdf_args = _pdf_args(pdf_data)
+    loads = _json.loads
+
+    return [
+        loads(_cached_call(_ExtractTextPositions, digest, pdf_args, page_num))
+        for page_num in range(start_page, end_page + 1)
+    ]
 
 def apply_redactions(pdf_data: bytes, redactions: list[dict]) -> bytes:
     """
@@ -68,15 +154,9 @@ def apply_redactions(pdf_data: bytes, redactions: list[dict]) -> bytes:
     if not redactions:
         return pdf_data
 
-    redactions_json = json.dumps(redactions).encode("utf-8")
+    redactions_json = _json.dumps(redactions)
     
-    lib = get_lib()
-    return call_bytes_result(
-        lib.ApplyRedactions,
-        pdf_data,
-        len(pdf_data),
-        redactions_json
-    )
+    return call_pdf_result(_ApplyRedactions(), pdf_data, redactions_json)
 
 def find_text_occurrences(pdf_data: bytes, text: str) -> list[dict]:
     """
@@ -92,15 +172,14 @@ def find_text_occurrences(pdf_data: bytes, text: str) -> list[dict]:
     if not pdf_data:
         raise ValueError("PDF data cannot be empty")
 
-    lib = get_lib()
-    result_bytes = call_bytes_result(
-        lib.FindTextOccurrences,
-        pdf_data,
-        len(pdf_data),
+    result_bytes = _cached_call(
+        _FindTextOccurrences,
+        _pdf_digest(pdf_data),
+        _pdf_args(pdf_data),
         text.encode("utf-8"),
     )
 
-    return json.loads(result_bytes)
+    return _json.loads(result_bytes)
 
 def apply_redactions_advanced(pdf_data: bytes, options: dict) -> bytes:
     """
@@ -120,12 +199,12 @@ def apply_redactions_advanced(pdf_data: bytes, options: dict) -> bytes:
     if not pdf_data:
         raise ValueError("PDF data cannot be empty")
 
-    options_json = json.dumps(options).encode("utf-8")
+    # Nothing to redact: skip encoding the options and the cgo call. Any
+    # option besides mode, even one not listed above, still goes to Go so
+    # it is validated and applied rather than silently ignored.
+    if not any(value for key, value in options.items() if key != "mode"):
+        return pdf_data
+
+    options_json = _json.dumps(options)
 
-    lib = get_lib()
-    return call_bytes_result(
-        lib.ApplyRedactionsAdvanced,
-        pdf_data,
-        len(pdf_data),
-        options_json,
-    )
+    return call_pdf_result(_ApplyRedactionsAdvanced(), pdf_data, options_json)
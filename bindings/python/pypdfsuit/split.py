@@ -2,11 +2,22 @@
 PDF splitting functionality.
 """
 
-import json
-from typing import List, Optional
+import os
+from ctypes import c_int
+from typing import Iterator, List, Optional, Union
 
+from . import _json
 from .types import SplitSpec
-from ._bindings import get_lib, call_bytes_result, call_bytes_array_result
+from ._bindings import (
+    lib_function,
+    call_bytes_result,
+    call_bytes_array_result,
+    iter_bytes_array_result,
+    mapped_file,
+)
+
+_SplitPDF = lib_function("SplitPDF")
+_ParsePageSpec = lib_function("ParsePageSpec")
 
 
 def split_pdf(pdf_data: bytes, spec: SplitSpec) -> List[bytes]:
@@ -35,20 +46,81 @@ def split_pdf(pdf_data: bytes, spec: SplitSpec) -> List[bytes]:
         >>> spec = SplitSpec(max_per_file=5)
         >>> parts = split_pdf(pdf_data, spec)
     """
+    return list(split_pdf_iter(pdf_data, spec))
+
+
+def split_pdf_iter(pdf_data: bytes, spec: SplitSpec) -> Iterator[bytes]:
+    """
+    Split a PDF and iterate over the parts one at a time.
+
+    Unlike split_pdf, each part is only copied into Python memory when the
+    iterator reaches it, so a consumer that writes parts out as it goes
+    never holds the full output set at once.
+
+    Args:
+        pdf_data: The PDF file content as bytes
+        spec: SplitSpec defining how to split the PDF
+
+    Returns:
+        Iterator[bytes]: Iterator over the PDF parts as bytes
+
+    Raises:
+        GoPDFSuitError: If splitting fails
+        ValueError: If pdf_data is empty
+
+    Example:
+        >>> from pypdfsuit import split_pdf_iter, SplitSpec
+        >>> spec = SplitSpec(max_per_file=1)
+        >>> for i, part in enumerate(split_pdf_iter(pdf_data, spec), 1):
+        ...     with open(f"page_{i}.pdf", "wb") as f:
+        ...         f.write(part)
+    """
     if not pdf_data:
         raise ValueError("PDF data cannot be empty")
 
-    lib = get_lib()
-    spec_json = json.dumps(spec.to_dict()).encode("utf-8")
+    spec_json = _json.dumps(spec.to_dict())
 
-    return call_bytes_array_result(
-        lib.SplitPDF,
+    return iter_bytes_array_result(
+        _SplitPDF(),
         pdf_data,
-        len(pdf_data),
+        c_int(len(pdf_data)),
         spec_json,
     )
 
 
+def split_pdf_path(pdf_path: Union[str, os.PathLike], spec: SplitSpec) -> List[bytes]:
+    """
+    Split a PDF file on disk into multiple parts based on the specification.
+
+    The file is memory-mapped and handed to Go directly, so large inputs are
+    never read into Python memory.
+
+    Args:
+        pdf_path: Path to the PDF file
+        spec: SplitSpec defining how to split the PDF
+
+    Returns:
+        List[bytes]: List of PDF parts as bytes
+
+    Raises:
+        GoPDFSuitError: If splitting fails
+        ValueError: If the file is empty
+
+    Example:
+        >>> from pypdfsuit import split_pdf_path, SplitSpec
+        >>> parts = split_pdf_path("document.pdf", SplitSpec(max_per_file=5))
+    """
+    spec_json = _json.dumps(spec.to_dict())
+
+    with mapped_file(pdf_path) as (pdf_ptr, pdf_len):
+        return call_bytes_array_result(
+            _SplitPDF(),
+            pdf_ptr,
+            pdf_len,
+            spec_json,
+        )
+
+
 def parse_page_spec(spec: str, total_pages: int = 0) -> List[int]:
     """
     Parse a page specification string into a sorted list of page numbers.
@@ -69,9 +141,8 @@ def parse_page_spec(spec: str, total_pages: int = 0) -> List[int]:
         >>> print(pages)
         [1, 2, 3, 5, 7, 8, 9]
     """
-    lib = get_lib()
     data = call_bytes_result(
-        lib.ParsePageSpec,
+        _ParsePageSpec(),
         spec.encode("utf-8"),
         total_pages,
     )
@@ -79,4 +150,4 @@ def parse_page_spec(spec: str, total_pages: int = 0) -> List[int]:
     if not data:
         return []
 
-    return json.loads(data.decode("utf-8"))
+    return _json.loads(data)
@@ -4,12 +4,23 @@ Type definitions for pypdfsuit.
 These types mirror the Go types in gopdfsuit/internal/models/models.go.
 """
 
+import sys
 from dataclasses import dataclass, field, asdict
 from functools import lru_cache
-from typing import Optional, List, Dict, Any, Tuple
+from types import MappingProxyType
+from typing import Optional, List, Dict, Any, Tuple, Callable
 
+from . import _json
 
-_JSON_KEY_MAPPING = {
+
+# dataclass(slots=True) is only available from Python 3.10; older versions
+# fall back to regular instance dictionaries.
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+# Python field name -> Go JSON key, for fields whose names differ. Read-only;
+# it is resolved once per dataclass by _dataclass_json_fields.
+_JSON_KEY_MAPPING = MappingProxyType({
     "page_border": "pageBorder",
     "page_alignment": "pageAlignment",
     "pdf_title": "pdfTitle",
@@ -56,45 +67,126 @@ _JSON_KEY_MAPPING = {
     "display_name": "displayName",
     "max_per_file": "MaxPerFile",
     "math_enabled": "mathEnabled",
-}
+})
 
 
 @lru_cache(maxsize=None)
 def _dataclass_json_fields(cls: type) -> Tuple[Tuple[str, str], ...]:
+    # Underscore-prefixed fields are internal state, not part of the payload.
     return tuple(
-        (field_name, _python_to_json_key(field_name))
+        (field_name, _JSON_KEY_MAPPING.get(field_name, field_name))
         for field_name in cls.__dataclass_fields__
+        if not field_name.startswith("_")
     )
 
 
+_SCALAR_TYPES = frozenset({str, int, float, bool})
+
+# Serializer per exact type: the built-in JSON types are registered below and
+# each dataclass is added the first time it is seen.
+_TYPE_SERIALIZERS: Dict[type, Callable[[Any, bool], Any]] = {}
+
+
+def _build_serializer(cls: type) -> Callable[[Any, bool], Dict[str, Any]]:
+    """
+    Generate a serializer function specialised for one dataclass.
+
+    The field reads and JSON keys are written into the function body, so a
+    call does plain attribute loads and constant dict stores instead of
+    reflecting over the fields and mapping their names every time.
+    """
+    lines = ["def serialize(obj, remove_none):", "    result = {}"]
+    for field_name, json_key in _dataclass_json_fields(cls):
+        lines += [
+            f"    value = obj.{field_name}",
+            "    if value is not None or not remove_none:",
+            f"        result[{json_key!r}] = (",
+            "            value if type(value) in _SCALAR_TYPES"
+            " else _to_dict(value, remove_none)",
+            "        )",
+        ]
+    lines.append("    return result")
+
+    namespace = {"_to_dict": _to_dict, "_SCALAR_TYPES": _SCALAR_TYPES}
+    exec("\n".join(lines), namespace)
+    serializer = namespace["serialize"]
+    serializer.__qualname__ = f"_serialize_{cls.__name__}"
+    return serializer
+
+
 def _to_dict(obj: Any, remove_none: bool = True) -> Any:
     """Convert a dataclass to a dictionary, optionally removing None values."""
-    if obj is None:
-        return None
+    serializer = _TYPE_SERIALIZERS.get(type(obj))
+    if serializer is not None:
+        return serializer(obj, remove_none)
+    # Subclasses of the built-in types (e.g. str enums) are not in the table.
     if isinstance(obj, (str, int, float, bool)):
         return obj
     if isinstance(obj, list):
-        return [_to_dict(item, remove_none) for item in obj]
+        return _ser_list(obj, remove_none)
     if isinstance(obj, dict):
-        return {k: _to_dict(v, remove_none) for k, v in obj.items()}
+        return _ser_dict(obj, remove_none)
     if hasattr(obj, "__dataclass_fields__"):
-        result = {}
-        for field_name, json_key in _dataclass_json_fields(type(obj)):
-            value = getattr(obj, field_name)
-            if value is None and remove_none:
-                continue
-            result[json_key] = _to_dict(value, remove_none)
-        return result
+        serializer = _TYPE_SERIALIZERS[type(obj)] = _build_serializer(type(obj))
+        return serializer(obj, remove_none)
+    return obj
+
+
+def _ser_identity(obj: Any, remove_none: bool) -> Any:
     return obj
 
 
-def _python_to_json_key(key: str) -> str:
-    """Convert Python snake_case to JSON camelCase where needed."""
-    return _JSON_KEY_MAPPING.get(key, key)
+def _ser_list(obj: list, remove_none: bool) -> list:
+    return [_to_dict(item, remove_none) for item in obj]
+
+
+def _ser_dict(obj: dict, remove_none: bool) -> dict:
+    return {k: _to_dict(v, remove_none) for k, v in obj.items()}
+
+
+_TYPE_SERIALIZERS.update(
+    {
+        type(None): _ser_identity,
+        str: _ser_identity,
+        int: _ser_identity,
+        float: _ser_identity,
+        bool: _ser_identity,
+        list: _ser_list,
+        dict: _ser_dict,
+    }
+)
+
+
+class _CachedDictMixin:
+    """
+    Cache to_dict() for configs that are built once and serialized many times.
+
+    The dictionary is computed by _build_dict() on first use and reused until
+    any field is assigned again. Subclasses must only hold scalar fields, as
+    in-place changes to a nested list would not invalidate the cache.
+
+    The cache lives in a slot on the mixin rather than in a dataclass field,
+    so it stays out of fields(), asdict(), repr() and comparisons.
+    """
+
+    __slots__ = ("_cached_dict",)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        if name != "_cached_dict":
+            object.__setattr__(self, "_cached_dict", None)
+
+    def to_dict(self) -> Dict[str, Any]:
+        cached = getattr(self, "_cached_dict", None)
+        if cached is None:
+            cached = self._build_dict()
+            object.__setattr__(self, "_cached_dict", cached)
+        # The values are scalars, so a shallow copy keeps the cache private.
+        return dict(cached)
 
 
-@dataclass
-class SecurityConfig:
+@dataclass(**_SLOTS)
+class SecurityConfig(_CachedDictMixin):
     """PDF encryption and permission settings."""
 
     enabled: bool = False
@@ -109,12 +201,12 @@ class SecurityConfig:
     allow_assembly: bool = False
     allow_high_quality_print: bool = True
 
-    def to_dict(self) -> Dict[str, Any]:
+    def _build_dict(self) -> Dict[str, Any]:
         return _to_dict(self)
 
 
-@dataclass
-class PDFAConfig:
+@dataclass(**_SLOTS)
+class PDFAConfig(_CachedDictMixin):
     """PDF/A compliance settings."""
 
     enabled: bool = False
@@ -125,11 +217,11 @@ class PDFAConfig:
     creator: Optional[str] = None
     keywords: Optional[str] = None
 
-    def to_dict(self) -> Dict[str, Any]:
+    def _build_dict(self) -> Dict[str, Any]:
         return _to_dict(self)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class SignatureConfig:
     """Digital signature settings."""
 
@@ -149,48 +241,22 @@ class SignatureConfig:
     name: Optional[str] = None
 
     def to_dict(self) -> Dict[str, Any]:
-        result = {
-            "enabled": self.enabled,
-            "certificatePem": self.certificate_pem,
-            "privateKeyPem": self.private_key_pem,
-            "visible": self.visible,
-            "page": self.page,
-            "x": self.x,
-            "y": self.y,
-            "width": self.width,
-            "height": self.height,
-        }
-        if self.certificate_chain is not None:
-            result["certificateChain"] = self.certificate_chain
-        if self.reason is not None:
-            result["reason"] = self.reason
-        if self.location is not None:
-            result["location"] = self.location
-        if self.contact_info is not None:
-            result["contactInfo"] = self.contact_info
-        if self.name is not None:
-            result["name"] = self.name
-        return result
-
-
-@dataclass
-class CustomFontConfig:
+        return _ser_signature_config(self)
+
+
+@dataclass(**_SLOTS)
+class CustomFontConfig(_CachedDictMixin):
     """Custom font configuration for embedding TTF/OTF fonts."""
 
     name: str  # Reference name used in props (e.g., "MyFont")
     file_path: Optional[str] = None  # Path to TTF/OTF file
     font_data: Optional[str] = None  # Base64-encoded font data
 
-    def to_dict(self) -> Dict[str, Any]:
-        result = {"name": self.name}
-        if self.file_path is not None:
-            result["filePath"] = self.file_path
-        if self.font_data is not None:
-            result["fontData"] = self.font_data
-        return result
+    def _build_dict(self) -> Dict[str, Any]:
+        return _ser_custom_font_config(self)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Bookmark:
     """PDF outline entry for document navigation."""
 
@@ -202,20 +268,10 @@ class Bookmark:
     open: bool = False  # Whether children are expanded by default
 
     def to_dict(self) -> Dict[str, Any]:
-        result = {
-            "title": self.title,
-            "page": self.page,
-            "y": self.y,
-            "open": self.open,
-        }
-        if self.dest is not None:
-            result["dest"] = self.dest
-        if self.children is not None:
-            result["children"] = [child.to_dict() for child in self.children]
-        return result
-
-
-@dataclass
+        return _ser_bookmark(self)
+
+
+@dataclass(**_SLOTS)
 class Config:
     """Page configuration and optional features."""
 
@@ -234,33 +290,10 @@ class Config:
     pdfa_compliant: bool = False
 
     def to_dict(self) -> Dict[str, Any]:
-        result = {
-            "page": self.page,
-            "pageAlignment": self.page_alignment,
-            "pageBorder": self.page_border,
-            "pdfaCompliant": self.pdfa_compliant,
-        }
-        if self.embed_fonts is not None:
-            result["embedFonts"] = self.embed_fonts
-        if self.watermark is not None:
-            result["watermark"] = self.watermark
-        if self.pdf_title is not None:
-            result["pdfTitle"] = self.pdf_title
-        result["arlingtonCompatible"] = self.arlington_compatible
-        if self.bookmarks is not None:
-            result["bookmarks"] = [bookmark.to_dict() for bookmark in self.bookmarks]
-        if self.security is not None:
-            result["security"] = self.security.to_dict()
-        if self.pdfa is not None:
-            result["pdfa"] = self.pdfa.to_dict()
-        if self.signature is not None:
-            result["signature"] = self.signature.to_dict()
-        if self.custom_fonts is not None:
-            result["customFonts"] = [font.to_dict() for font in self.custom_fonts]
-        return result
-
-
-@dataclass
+        return _ser_config(self)
+
+
+@dataclass(**_SLOTS)
 class Image:
     """Image element in the PDF."""
 
@@ -271,18 +304,10 @@ class Image:
     link: Optional[str] = None
 
     def to_dict(self) -> Dict[str, Any]:
-        result = {
-            "imagename": self.image_name,
-            "imagedata": self.image_data,
-            "width": self.width,
-            "height": self.height,
-        }
-        if self.link is not None:
-            result["link"] = self.link
-        return result
-
-
-@dataclass
+        return _ser_image(self)
+
+
+@dataclass(**_SLOTS)
 class FormField:
     """Fillable form field."""
 
@@ -294,20 +319,10 @@ class FormField:
     shape: Optional[str] = None  # "round" or "square" (for radio)
 
     def to_dict(self) -> Dict[str, Any]:
-        result = {
-            "type": self.type,
-            "name": self.name,
-            "value": self.value,
-            "checked": self.checked,
-        }
-        if self.group_name is not None:
-            result["group_name"] = self.group_name
-        if self.shape is not None:
-            result["shape"] = self.shape
-        return result
-
-
-@dataclass
+        return _ser_form_field(self)
+
+
+@dataclass(**_SLOTS)
 class Cell:
     """Cell in a table row."""
 
@@ -326,46 +341,20 @@ class Cell:
     math_enabled: Optional[bool] = None
 
     def to_dict(self) -> Dict[str, Any]:
-        result = {
-            "props": self.props,
-            "text": self.text,
-        }
-        if self.checkbox is not None:
-            result["chequebox"] = self.checkbox
-        if self.image is not None:
-            result["image"] = self.image.to_dict()
-        if self.width is not None:
-            result["width"] = self.width
-        if self.height is not None:
-            result["height"] = self.height
-        if self.form_field is not None:
-            result["form_field"] = self.form_field.to_dict()
-        if self.bg_color is not None:
-            result["bgcolor"] = self.bg_color
-        if self.text_color is not None:
-            result["textcolor"] = self.text_color
-        if self.link is not None:
-            result["link"] = self.link
-        if self.wrap is not None:
-            result["wrap"] = self.wrap
-        if self.dest is not None:
-            result["dest"] = self.dest
-        if self.math_enabled is not None:
-            result["mathEnabled"] = self.math_enabled
-        return result
-
-
-@dataclass
+        return _ser_cell(self)
+
+
+@dataclass(**_SLOTS)
 class Row:
     """Row in a table."""
 
     row: List[Cell] = field(default_factory=list)
 
     def to_dict(self) -> Dict[str, Any]:
-        return {"row": [cell.to_dict() for cell in self.row]}
+        return _ser_row(self)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Table:
     """Table element in the PDF."""
 
@@ -377,32 +366,20 @@ class Table:
     text_color: Optional[str] = None
 
     def to_dict(self) -> Dict[str, Any]:
-        result = {
-            "maxcolumns": self.max_columns,
-            "rows": [row.to_dict() for row in self.rows],
-        }
-        if self.column_widths is not None:
-            result["columnwidths"] = self.column_widths
-        if self.row_heights is not None:
-            result["rowheights"] = self.row_heights
-        if self.bg_color is not None:
-            result["bgcolor"] = self.bg_color
-        if self.text_color is not None:
-            result["textcolor"] = self.text_color
-        return result
-
-
-@dataclass
+        return _ser_table(self)
+
+
+@dataclass(**_SLOTS)
 class Spacer:
     """Vertical space between elements."""
 
     height: float
 
     def to_dict(self) -> Dict[str, Any]:
-        return {"height": self.height}
+        return _ser_spacer(self)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Element:
     """Ordered element in the PDF (table, spacer, or image)."""
 
@@ -413,19 +390,10 @@ class Element:
     image: Optional[Image] = None
 
     def to_dict(self) -> Dict[str, Any]:
-        result = {"type": self.type}
-        if self.index is not None:
-            result["index"] = self.index
-        if self.table is not None:
-            result["table"] = self.table.to_dict()
-        if self.spacer is not None:
-            result["spacer"] = self.spacer.to_dict()
-        if self.image is not None:
-            result["image"] = self.image.to_dict()
-        return result
-
-
-@dataclass
+        return _ser_element(self)
+
+
+@dataclass(**_SLOTS)
 class TitleTable:
     """Embedded table within the title section."""
 
@@ -434,16 +402,10 @@ class TitleTable:
     column_widths: Optional[List[float]] = None
 
     def to_dict(self) -> Dict[str, Any]:
-        result = {
-            "maxcolumns": self.max_columns,
-            "rows": [row.to_dict() for row in self.rows],
-        }
-        if self.column_widths is not None:
-            result["columnwidths"] = self.column_widths
-        return result
+        return _ser_title_table(self)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Title:
     """Document title section."""
 
@@ -455,34 +417,22 @@ class Title:
     link: Optional[str] = None
 
     def to_dict(self) -> Dict[str, Any]:
-        result = {"props": self.props, "text": self.text}
-        if self.table is not None:
-            result["table"] = self.table.to_dict()
-        if self.bg_color is not None:
-            result["bgcolor"] = self.bg_color
-        if self.text_color is not None:
-            result["textcolor"] = self.text_color
-        if self.link is not None:
-            result["link"] = self.link
-        return result
-
-
-@dataclass
-class Footer:
+        return _ser_title(self)
+
+
+@dataclass(**_SLOTS)
+class Footer(_CachedDictMixin):
     """Document footer."""
 
     font: str
     text: str
     link: Optional[str] = None
 
-    def to_dict(self) -> Dict[str, Any]:
-        result = {"font": self.font, "text": self.text}
-        if self.link is not None:
-            result["link"] = self.link
-        return result
+    def _build_dict(self) -> Dict[str, Any]:
+        return _ser_footer(self)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class PDFTemplate:
     """Main input structure for PDF generation."""
 
@@ -496,26 +446,14 @@ class PDFTemplate:
     bookmarks: Optional[List[Bookmark]] = None
 
     def to_dict(self) -> Dict[str, Any]:
-        result = {
-            "config": self.config.to_dict(),
-            "title": self.title.to_dict(),
-        }
-        if self.table is not None:
-            result["table"] = [t.to_dict() for t in self.table]
-        if self.spacer is not None:
-            result["spacer"] = [s.to_dict() for s in self.spacer]
-        if self.image is not None:
-            result["image"] = [i.to_dict() for i in self.image]
-        if self.elements is not None:
-            result["elements"] = [e.to_dict() for e in self.elements]
-        if self.footer is not None:
-            result["footer"] = self.footer.to_dict()
-        if self.bookmarks is not None:
-            result["bookmarks"] = [b.to_dict() for b in self.bookmarks]
-        return result
-
-
-@dataclass
+        return _ser_pdf_template(self)
+
+    def to_json_bytes(self) -> bytes:
+        """Serialize the template to the UTF-8 JSON payload GeneratePDF expects."""
+        return _json.dumps(_ser_pdf_template(self))
+
+
+@dataclass(frozen=True, **_SLOTS)
 class FontInfo:
     """Font information."""
 
@@ -528,7 +466,7 @@ class FontInfo:
         return _to_dict(self)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class HtmlToPDFRequest:
     """Input for HTML to PDF conversion."""
 
@@ -550,7 +488,7 @@ class HtmlToPDFRequest:
         return _to_dict(self)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class HtmlToImageRequest:
     """Input for HTML to image conversion."""
 
@@ -572,7 +510,7 @@ class HtmlToImageRequest:
         return _to_dict(self)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class SplitSpec:
     """Split criteria for splitting PDFs."""
 
@@ -581,11 +519,243 @@ class SplitSpec:
     max_per_file: Optional[int] = None  # Maximum pages per output file
 
     def to_dict(self) -> Dict[str, Any]:
-        result = {}
-        if self.pages is not None:
-            result["Pages"] = self.pages
-        if self.ranges is not None:
-            result["Ranges"] = [[r[0], r[1]] for r in self.ranges]
-        if self.max_per_file is not None:
-            result["MaxPerFile"] = self.max_per_file
-        return result
+        return _ser_split_spec(self)
+
+
+# Serializers for the hand-mapped types. They live at module level and call
+# each other directly, so serializing a nested template does no method
+# lookups; each class's to_dict() forwards to its function here.
+
+
+def _ser_signature_config(obj: SignatureConfig) -> Dict[str, Any]:
+    result = {
+        "enabled": obj.enabled,
+        "certificatePem": obj.certificate_pem,
+        "privateKeyPem": obj.private_key_pem,
+        "visible": obj.visible,
+        "page": obj.page,
+        "x": obj.x,
+        "y": obj.y,
+        "width": obj.width,
+        "height": obj.height,
+    }
+    if obj.certificate_chain is not None:
+        result["certificateChain"] = obj.certificate_chain
+    if obj.reason is not None:
+        result["reason"] = obj.reason
+    if obj.location is not None:
+        result["location"] = obj.location
+    if obj.contact_info is not None:
+        result["contactInfo"] = obj.contact_info
+    if obj.name is not None:
+        result["name"] = obj.name
+    return result
+
+
+def _ser_custom_font_config(obj: CustomFontConfig) -> Dict[str, Any]:
+    result = {"name": obj.name}
+    if obj.file_path is not None:
+        result["filePath"] = obj.file_path
+    if obj.font_data is not None:
+        result["fontData"] = obj.font_data
+    return result
+
+
+def _ser_bookmark(obj: Bookmark) -> Dict[str, Any]:
+    result = {
+        "title": obj.title,
+        "page": obj.page,
+        "y": obj.y,
+        "open": obj.open,
+    }
+    if obj.dest is not None:
+        result["dest"] = obj.dest
+    if obj.children is not None:
+        result["children"] = list(map(_ser_bookmark, obj.children))
+    return result
+
+
+def _ser_config(obj: Config) -> Dict[str, Any]:
+    result = {
+        "page": obj.page,
+        "pageAlignment": obj.page_alignment,
+        "pageBorder": obj.page_border,
+        "pdfaCompliant": obj.pdfa_compliant,
+    }
+    if obj.embed_fonts is not None:
+        result["embedFonts"] = obj.embed_fonts
+    if obj.watermark is not None:
+        result["watermark"] = obj.watermark
+    if obj.pdf_title is not None:
+        result["pdfTitle"] = obj.pdf_title
+    result["arlingtonCompatible"] = obj.arlington_compatible
+    if obj.bookmarks is not None:
+        result["bookmarks"] = list(map(_ser_bookmark, obj.bookmarks))
+    if obj.security is not None:
+        result["security"] = obj.security.to_dict()
+    if obj.pdfa is not None:
+        result["pdfa"] = obj.pdfa.to_dict()
+    if obj.signature is not None:
+        result["signature"] = _ser_signature_config(obj.signature)
+    if obj.custom_fonts is not None:
+        result["customFonts"] = [font.to_dict() for font in obj.custom_fonts]
+    return result
+
+
+def _ser_image(obj: Image) -> Dict[str, Any]:
+    result = {
+        "imagename": obj.image_name,
+        "imagedata": obj.image_data,
+        "width": obj.width,
+        "height": obj.height,
+    }
+    if obj.link is not None:
+        result["link"] = obj.link
+    return result
+
+
+def _ser_form_field(obj: FormField) -> Dict[str, Any]:
+    result = {
+        "type": obj.type,
+        "name": obj.name,
+        "value": obj.value,
+        "checked": obj.checked,
+    }
+    if obj.group_name is not None:
+        result["group_name"] = obj.group_name
+    if obj.shape is not None:
+        result["shape"] = obj.shape
+    return result
+
+
+def _ser_cell(obj: Cell) -> Dict[str, Any]:
+    result = {
+        "props": obj.props,
+        "text": obj.text,
+    }
+    if obj.checkbox is not None:
+        result["chequebox"] = obj.checkbox
+    if obj.image is not None:
+        result["image"] = _ser_image(obj.image)
+    if obj.width is not None:
+        result["width"] = obj.width
+    if obj.height is not None:
+        result["height"] = obj.height
+    if obj.form_field is not None:
+        result["form_field"] = _ser_form_field(obj.form_field)
+    if obj.bg_color is not None:
+        result["bgcolor"] = obj.bg_color
+    if obj.text_color is not None:
+        result["textcolor"] = obj.text_color
+    if obj.link is not None:
+        result["link"] = obj.link
+    if obj.wrap is not None:
+        result["wrap"] = obj.wrap
+    if obj.dest is not None:
+        result["dest"] = obj.dest
+    if obj.math_enabled is not None:
+        result["mathEnabled"] = obj.math_enabled
+    return result
+
+
+def _ser_row(obj: Row) -> Dict[str, Any]:
+    return {"row": list(map(_ser_cell, obj.row))}
+
+
+def _ser_rows(rows: List[Row]) -> List[Dict[str, Any]]:
+    # Same output as mapping _ser_row, without a function call per row.
+    return [{"row": list(map(_ser_cell, row.row))} for row in rows]
+
+
+def _ser_table(obj: Table) -> Dict[str, Any]:
+    result = {
+        "maxcolumns": obj.max_columns,
+        "rows": _ser_rows(obj.rows),
+    }
+    if obj.column_widths is not None:
+        result["columnwidths"] = obj.column_widths
+    if obj.row_heights is not None:
+        result["rowheights"] = obj.row_heights
+    if obj.bg_color is not None:
+        result["bgcolor"] = obj.bg_color
+    if obj.text_color is not None:
+        result["textcolor"] = obj.text_color
+    return result
+
+
+def _ser_spacer(obj: Spacer) -> Dict[str, Any]:
+    return {"height": obj.height}
+
+
+def _ser_element(obj: Element) -> Dict[str, Any]:
+    result = {"type": obj.type}
+    if obj.index is not None:
+        result["index"] = obj.index
+    if obj.table is not None:
+        result["table"] = _ser_table(obj.table)
+    if obj.spacer is not None:
+        result["spacer"] = _ser_spacer(obj.spacer)
+    if obj.image is not None:
+        result["image"] = _ser_image(obj.image)
+    return result
+
+
+def _ser_title_table(obj: TitleTable) -> Dict[str, Any]:
+    result = {
+        "maxcolumns": obj.max_columns,
+        "rows": _ser_rows(obj.rows),
+    }
+    if obj.column_widths is not None:
+        result["columnwidths"] = obj.column_widths
+    return result
+
+
+def _ser_title(obj: Title) -> Dict[str, Any]:
+    result = {"props": obj.props, "text": obj.text}
+    if obj.table is not None:
+        result["table"] = _ser_title_table(obj.table)
+    if obj.bg_color is not None:
+        result["bgcolor"] = obj.bg_color
+    if obj.text_color is not None:
+        result["textcolor"] = obj.text_color
+    if obj.link is not None:
+        result["link"] = obj.link
+    return result
+
+
+def _ser_footer(obj: Footer) -> Dict[str, Any]:
+    result = {"font": obj.font, "text": obj.text}
+    if obj.link is not None:
+        result["link"] = obj.link
+    return result
+
+
+def _ser_pdf_template(obj: PDFTemplate) -> Dict[str, Any]:
+    result = {
+        "config": _ser_config(obj.config),
+        "title": _ser_title(obj.title),
+    }
+    if obj.table is not None:
+        result["table"] = list(map(_ser_table, obj.table))
+    if obj.spacer is not None:
+        result["spacer"] = list(map(_ser_spacer, obj.spacer))
+    if obj.image is not None:
+        result["image"] = list(map(_ser_image, obj.image))
+    if obj.elements is not None:
+        result["elements"] = list(map(_ser_element, obj.elements))
+    if obj.footer is not None:
+        result["footer"] = obj.footer.to_dict()
+    if obj.bookmarks is not None:
+        result["bookmarks"] = list(map(_ser_bookmark, obj.bookmarks))
+    return result
+
+
+def _ser_split_spec(obj: SplitSpec) -> Dict[str, Any]:
+    result = {}
+    if obj.pages is not None:
+        result["Pages"] = obj.pages
+    if obj.ranges is not None:
+        result["Ranges"] = [[r[0], r[1]] for r in obj.ranges]
+    if obj.max_per_file is not None:
+        result["MaxPerFile"] = obj.max_per_file
+    return result
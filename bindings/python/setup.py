@@ -1,10 +1,31 @@
+import os
+
 from setuptools import setup, Distribution
+from setuptools.command.build_py import build_py
+
+LIB_NAMES = ("libgopdfsuit.so", "libgopdfsuit.dylib", "gopdfsuit.dll")
+
 
 class BinaryDistribution(Distribution):
     """Distribution which always forces a binary package with platform name"""
     def has_ext_modules(self):
         return True
 
+
+class BuildPyWithLibPath(build_py):
+    """Bake the bundled shared library's path into pypdfsuit/_lib_path.py"""
+    def run(self):
+        super().run()
+        package_dir = os.path.join(self.build_lib, "pypdfsuit")
+        for lib_name in LIB_NAMES:
+            if os.path.exists(os.path.join(package_dir, "lib", lib_name)):
+                with open(os.path.join(package_dir, "_lib_path.py"), "w") as f:
+                    f.write("# Generated by setup.py at build time.\n")
+                    f.write(f"LIB_PATH = {'lib/' + lib_name!r}\n")
+                break
+
+
 setup(
-    distclass=BinaryDistribution
+    distclass=BinaryDistribution,
+    cmdclass={"build_py": BuildPyWithLibPath},
 )
@@ -4,23 +4,87 @@ Pytest configuration and fixtures for pypdfsuit tests.
 
 import os
 import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
+from typing import Sequence
 
 import pytest
 
+# Paths used by the autobuild, resolved once at import time.
+_PYTHON_DIR = Path(__file__).resolve().parents[1]
+_REPO_ROOT = _PYTHON_DIR.parents[1]
+_LIB_PATH = _PYTHON_DIR / "pypdfsuit" / "lib" / "libgopdfsuit.so"
+_SOURCE_ROOTS = (
+    _REPO_ROOT / "bindings" / "python" / "cgo",
+    _REPO_ROOT / "pkg" / "gopdflib",
+    _REPO_ROOT / "internal" / "pdf",
+)
+_SAMPLEDATA = _REPO_ROOT / "sampledata"
+_GO_BUILD_ARGS = (
+    "go",
+    "build",
+    "-buildmode=c-shared",
+    "-o",
+    str(_LIB_PATH),
+    "./bindings/python/cgo/",
+)
 
-def _should_rebuild(lib_path: Path, source_roots: list[Path]) -> bool:
+
+def _root_has_newer(root: Path, lib_mtime: float) -> bool:
+    """Return True as soon as any .go file under root is newer than lib_mtime."""
+    stack = [str(root)]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(".go"):
+                    if entry.stat(follow_symlinks=False).st_mtime > lib_mtime:
+                        return True
+    return False
+
+
+def _should_rebuild(lib_path: Path, source_roots: Sequence[Path]) -> bool:
     if not lib_path.exists():
         return True
 
     lib_mtime = lib_path.stat().st_mtime
-    for root in source_roots:
-        if not root.exists():
-            continue
-        for path in root.rglob("*.go"):
-            if path.stat().st_mtime > lib_mtime:
-                return True
-    return False
+    if not source_roots:
+        return False
+
+    # The walks are stat-bound and release the GIL, so scan the roots
+    # concurrently. The pool is shut down without waiting, so the first
+    # newer file found decides the result while the other walks finish in
+    # the background.
+    pool = ThreadPoolExecutor(max_workers=len(source_roots))
+    try:
+        futures = [
+            pool.submit(_root_has_newer, root, lib_mtime) for root in source_roots
+        ]
+        return any(future.result() for future in as_completed(futures))
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _build_library() -> None:
+    """Build the shared library in place, as build.sh does on Linux.
+
+    Calling go build directly skips the shell wrapper and its `file`
+    report; go reuses its build cache, so only changed packages recompile.
+    """
+    _LIB_PATH.parent.mkdir(parents=True, exist_ok=True)
+    subprocess.run(
+        _GO_BUILD_ARGS,
+        check=True,
+        cwd=str(_REPO_ROOT),
+        env={**os.environ, "CGO_ENABLED": "1"},
+    )
+    # Keep generated headers in sync with exports, matching build.sh.
+    (_LIB_PATH.parent / "gopdfsuit.h").unlink(missing_ok=True)
 
 
 def pytest_sessionstart(session):
@@ -28,36 +92,110 @@ def pytest_sessionstart(session):
     if os.getenv("PYPDFSUIT_SKIP_AUTO_BUILD") == "1":
         return
 
-    python_dir = Path(__file__).resolve().parents[1]
-    repo_root = python_dir.parents[1]
-    lib_name = "libgopdfsuit.so"
-    lib_path = python_dir / "pypdfsuit" / "lib" / lib_name
-    source_roots = [
-        repo_root / "bindings" / "python" / "cgo",
-        repo_root / "pkg" / "gopdflib",
-        repo_root / "internal" / "pdf",
-    ]
-
-    if not _should_rebuild(lib_path, source_roots):
+    if not _should_rebuild(_LIB_PATH, _SOURCE_ROOTS):
         return
 
-    build_script = python_dir / "build.sh"
-    subprocess.run([str(build_script)], check=True, cwd=str(python_dir))
+    _build_library()
 
 
-@pytest.fixture
-def simple_html():
-    """Simple HTML content for testing."""
-    return "<html><body><h1>Test</h1></body></html>"
-
+_SIMPLE_HTML = "<html><body><h1>Test</h1></body></html>"
 
-@pytest.fixture
-def simple_xfdf():
-    """Simple XFDF content for testing."""
-    return b"""<?xml version="1.0" encoding="UTF-8"?>
+_SIMPLE_XFDF = b"""<?xml version="1.0" encoding="UTF-8"?>
 <xfdf xmlns="http://ns.adobe.com/xfdf/">
     <fields>
         <field name="Name"><value>John Doe</value></field>
         <field name="Email"><value>john@example.com</value></field>
     </fields>
 </xfdf>"""
+
+
+@pytest.fixture(scope="session")
+def simple_html():
+    """Simple HTML content for testing."""
+    return _SIMPLE_HTML
+
+
+@pytest.fixture(scope="session")
+def simple_xfdf():
+    """Simple XFDF content for testing."""
+    return _SIMPLE_XFDF
+
+
+# Sample inputs read by the fixtures below, prefetched concurrently the
+# first time a test needs one of them.
+_PREFETCH_SAMPLES = (
+    ("split", "em.pdf"),
+    ("merge", "em-16.pdf"),
+    ("merge", "em-19.pdf"),
+    ("merge", "em-51.pdf"),
+    ("filler", "us_hospital_encounter_acroform.pdf"),
+    ("filler", "us_hospital_encounter_data.xfdf"),
+)
+_sample_cache: dict[Path, bytes] = {}
+
+
+def _load_sample(path: Path) -> None:
+    try:
+        _sample_cache[path] = path.read_bytes()
+    except FileNotFoundError:
+        pass
+
+
+@pytest.fixture(scope="session")
+def _prefetch_sampledata():
+    """Read the sample inputs in parallel for the fixtures that use them."""
+    paths = [_SAMPLEDATA.joinpath(*parts) for parts in _PREFETCH_SAMPLES]
+    with ThreadPoolExecutor(max_workers=len(paths)) as pool:
+        list(pool.map(_load_sample, paths))
+
+
+def _read_sample(*parts: str) -> bytes:
+    """Read a sampledata file, skipping the requesting test when it is absent."""
+    path = _SAMPLEDATA.joinpath(*parts)
+    data = _sample_cache.get(path)
+    if data is not None:
+        return data
+    if not path.exists():
+        pytest.skip(f"Sample file not found: {path}")
+    return path.read_bytes()
+
+
+@pytest.fixture(scope="session")
+def em_pdf_bytes(_prefetch_sampledata):
+    """sampledata/split/em.pdf, read once per session."""
+    return _read_sample("split", "em.pdf")
+
+
+@pytest.fixture(scope="session")
+def merge_pdf_bytes(_prefetch_sampledata):
+    """The three sampledata/merge inputs, read once per session."""
+    return tuple(
+        _read_sample("merge", name)
+        for name in ("em-16.pdf", "em-19.pdf", "em-51.pdf")
+    )
+
+
+@pytest.fixture(scope="session")
+def filler_pdf_bytes(_prefetch_sampledata):
+    """The hospital encounter AcroForm, read once per session."""
+    return _read_sample("filler", "us_hospital_encounter_acroform.pdf")
+
+
+@pytest.fixture(scope="session")
+def filler_xfdf_bytes(_prefetch_sampledata):
+    """XFDF data for the hospital encounter form, read once per session."""
+    return _read_sample("filler", "us_hospital_encounter_data.xfdf")
+
+
+@pytest.fixture(scope="session")
+def financial_report_bytes():
+    """The financial report, generated once per session from its JSON template.
+
+    Generating it here instead of reading financial_report.pdf keeps the
+    fixture independent of the test that writes that file, so it is safe
+    under pytest-xdist.
+    """
+    from pypdfsuit._bindings import call_bytes_result, lib_function
+
+    template = _read_sample("financialreport", "financial_report.json")
+    return call_bytes_result(lib_function("GeneratePDF")(), template)
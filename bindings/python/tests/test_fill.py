@@ -3,7 +3,7 @@ Tests for PDF form filling functionality.
 """
 
 import pytest
-from pypdfsuit import fill_pdf_with_xfdf
+from pypdfsuit import fill_pdf_with_xfdf, fill_pdf_with_xfdf_path
 from pypdfsuit._bindings import GoPDFSuitError
 
 
@@ -26,3 +26,13 @@ class TestFillPDFWithXFDF:
         """Test that empty XFDF raises error."""
         with pytest.raises(ValueError):
             fill_pdf_with_xfdf(b"%PDF-1.4...", b"")
+
+    def test_empty_pdf_path_raises_error(self, tmp_path, simple_xfdf):
+        """Test that an empty PDF file raises error without calling Go."""
+        pdf_path = tmp_path / "empty.pdf"
+        pdf_path.write_bytes(b"")
+        xfdf_path = tmp_path / "data.xfdf"
+        xfdf_path.write_bytes(simple_xfdf)
+
+        with pytest.raises(ValueError):
+            fill_pdf_with_xfdf_path(pdf_path, xfdf_path)
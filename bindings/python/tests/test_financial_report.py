@@ -1,26 +1,26 @@
 """Integration test: generate PDF from sampledata/financialreport/financial_report.json."""
 
-import json
 from pathlib import Path
 
 import pytest
 
-from pypdfsuit._bindings import call_bytes_result, get_lib
+from pypdfsuit import _json
+from pypdfsuit._bindings import call_bytes_result, lib_function
 
 _REPO = Path(__file__).resolve().parents[3]
 _JSON = _REPO / "sampledata" / "financialreport" / "financial_report.json"
 _OUT = _REPO / "sampledata" / "financialreport" / "financial_report.pdf"
 
+_GeneratePDF = lib_function("GeneratePDF")
+
 
 def _generate_pdf_from_dict(template_dict: dict) -> bytes:
-    lib = get_lib()
-    template_json = json.dumps(template_dict).encode("utf-8")
-    return call_bytes_result(lib.GeneratePDF, template_json)
+    return call_bytes_result(_GeneratePDF(), _json.dumps(template_dict))
 
 
 @pytest.mark.skipif(not _JSON.exists(), reason="financial_report.json not found")
 def test_generate_financial_report_pdf():
-    template_dict = json.loads(_JSON.read_text())
+    template_dict = _json.loads(_JSON.read_bytes())
     pdf_bytes = _generate_pdf_from_dict(template_dict)
 
     assert pdf_bytes[:5] == b"%PDF-"
@@ -3,8 +3,8 @@ Tests for PDF generation functionality.
 """
 
 import pytest
-import json
 
+from pypdfsuit import _json
 from pypdfsuit import (
     generate_pdf,
     get_available_fonts,
@@ -190,14 +190,14 @@ class TestGeneratePDF:
             elements=[],
         )
         dumps_calls = 0
-        original_dumps = json.dumps
+        original_dumps = _json.dumps
 
         def counting_dumps(*args, **kwargs):
             nonlocal dumps_calls
             dumps_calls += 1
             return original_dumps(*args, **kwargs)
 
-        monkeypatch.setattr(json, "dumps", counting_dumps)
+        monkeypatch.setattr(_json, "dumps", counting_dumps)
 
         pdf_one = generate_pdf(template)
         pdf_two = generate_pdf(template)
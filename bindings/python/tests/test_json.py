@@ -0,0 +1,41 @@
+"""
+Tests for the JSON backend shared by all payloads sent to Go.
+"""
+
+import json
+
+import pytest
+
+from pypdfsuit import _json
+
+
+class _Float(float):
+    pass
+
+
+class _Int(int):
+    pass
+
+
+def _stdlib_dumps(obj) -> bytes:
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+@pytest.mark.parametrize(
+    "obj",
+    [
+        {"x": _Float(1.5), "y": _Int(2)},
+        [{"x": _Float(0.25)}],
+        {1: "one", 2.5: "two and a half", None: "none"},
+        {"text": "Zoë", "nested": {"values": [1, 2.0, True, None]}},
+    ],
+)
+def test_dumps_matches_stdlib_json(obj):
+    """Test that the active backend accepts and encodes what json does."""
+    assert _json.dumps(obj) == _stdlib_dumps(obj)
+
+
+def test_dumps_rejects_unsupported_types():
+    """Test that non-JSON types still raise TypeError."""
+    with pytest.raises(TypeError):
+        _json.dumps({"value": {1, 2}})
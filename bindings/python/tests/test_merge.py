@@ -2,6 +2,8 @@
 Tests for PDF merging functionality.
 """
 
+from functools import lru_cache
+
 import pytest
 from pypdfsuit import (
     merge_pdfs,
@@ -13,8 +15,9 @@ from pypdfsuit import (
 from pypdfsuit._bindings import GoPDFSuitError
 
 
+@lru_cache(maxsize=64)
 def create_simple_pdf(title: str) -> bytes:
-    """Helper to create a simple PDF for testing."""
+    """Helper to create a simple PDF for testing (cached per title)."""
     template = PDFTemplate(
         config=Config(page="A4", page_alignment=1),
         title=Title(
@@ -0,0 +1,188 @@
+"""
+Tests for the redaction query helpers and their result cache.
+"""
+
+import pytest
+
+from pypdfsuit import _json, redact
+
+
+def _accessor(name):
+    return lambda: name
+
+
+@pytest.fixture
+def go_calls(monkeypatch):
+    """Replace the Go call with a recorder that echoes its arguments."""
+    calls = []
+
+    def fake_call_bytes_result(func, *args):
+        calls.append((func, args[2:]))
+        return _json.dumps([str(arg) for arg in args[2:]])
+
+    monkeypatch.setattr(redact, "call_bytes_result", fake_call_bytes_result)
+    monkeypatch.setattr(
+        redact, "_ExtractTextPositions", _accessor("ExtractTextPositions")
+    )
+    redact._clear_result_cache()
+    yield calls
+    redact._clear_result_cache()
+
+
+class TestResultCache:
+    """Tests for the byte-bounded cache of read-only query results."""
+
+    def test_repeated_query_is_a_hit(self, go_calls):
+        """Test that the same query on the same PDF only calls Go once."""
+        pdf = b"%PDF-1.7 one"
+        digest = redact._pdf_digest(pdf)
+        query = _accessor("ExtractTextPositions")
+
+        first = redact._cached_call(query, digest, redact._pdf_args(pdf), 1)
+        second = redact._cached_call(query, digest, redact._pdf_args(pdf), 1)
+
+        assert first == second
+        assert len(go_calls) == 1
+
+    def test_different_pdf_is_a_miss(self, go_calls):
+        """Test that the PDF content is part of the cache key."""
+        query = _accessor("GetPageInfo")
+
+        for pdf in (b"%PDF-1.7 one", b"%PDF-1.7 two"):
+            redact._cached_call(query, redact._pdf_digest(pdf), redact._pdf_args(pdf))
+
+        assert len(go_calls) == 2
+
+    def test_extra_arguments_are_part_of_the_key(self, go_calls):
+        """Test that page numbers and search text select separate entries."""
+        pdf = b"%PDF-1.7 one"
+        digest = redact._pdf_digest(pdf)
+        positions = _accessor("ExtractTextPositions")
+        find = _accessor("FindTextOccurrences")
+
+        page1 = redact._cached_call(positions, digest, redact._pdf_args(pdf), 1)
+        page2 = redact._cached_call(positions, digest, redact._pdf_args(pdf), 2)
+        total = redact._cached_call(find, digest, redact._pdf_args(pdf), b"Total")
+        section = redact._cached_call(find, digest, redact._pdf_args(pdf), b"SECTION")
+
+        assert page1 != page2
+        assert total != section
+        assert len(go_calls) == 4
+
+        redact._cached_call(positions, digest, redact._pdf_args(pdf), 2)
+        redact._cached_call(find, digest, redact._pdf_args(pdf), b"Total")
+        assert len(go_calls) == 4
+
+    def test_cache_is_bounded_by_total_bytes(self, go_calls, monkeypatch):
+        """Test that least recently used results are evicted by size."""
+        monkeypatch.setattr(redact, "_RESULT_CACHE_MAX_BYTES", 16)
+        pdf = b"%PDF-1.7 one"
+        digest = redact._pdf_digest(pdf)
+        query = _accessor("ExtractTextPositions")
+
+        for page_num in range(1, 11):
+            redact._cached_call(query, digest, redact._pdf_args(pdf), page_num)
+
+        assert 0 < redact._result_cache_bytes <= 16
+        assert redact._result_cache_bytes == sum(
+            len(data) for data in redact._result_cache.values()
+        )
+
+        redact._cached_call(query, digest, redact._pdf_args(pdf), 10)
+        assert len(go_calls) == 10
+        redact._cached_call(query, digest, redact._pdf_args(pdf), 1)
+        assert len(go_calls) == 11
+
+    def test_oversized_result_is_not_cached(self, go_calls, monkeypatch):
+        """Test that a result larger than the budget bypasses the cache."""
+        monkeypatch.setattr(redact, "_RESULT_CACHE_MAX_BYTES", 1)
+        pdf = b"%PDF-1.7 one"
+        digest = redact._pdf_digest(pdf)
+        query = _accessor("GetPageInfo")
+
+        redact._cached_call(query, digest, redact._pdf_args(pdf))
+        redact._cached_call(query, digest, redact._pdf_args(pdf))
+
+        assert len(go_calls) == 2
+        assert redact._result_cache_bytes == 0
+
+
+class TestExtractTextPositionsRange:
+    """Tests for the page-range convenience wrapper."""
+
+    def test_range_returns_one_result_per_page(self, go_calls):
+        """Test that each page in the inclusive range is queried in order."""
+        pdf = b"%PDF-1.7 one"
+
+        pages = redact.extract_text_positions_range(pdf, 2, 4)
+
+        assert pages == [["2"], ["3"], ["4"]]
+        assert len(go_calls) == 3
+
+    def test_range_shares_cache_with_single_page_calls(self, go_calls):
+        """Test that pages already extracted are served from the cache."""
+        pdf = b"%PDF-1.7 one"
+
+        assert redact.extract_text_positions(pdf, 1) == ["1"]
+        assert redact.extract_text_positions_range(pdf, 1, 2) == [["1"], ["2"]]
+        assert len(go_calls) == 2
+
+    def test_single_page_range(self, go_calls):
+        """Test that a range with equal bounds returns one page."""
+        assert redact.extract_text_positions_range(b"%PDF-1.7 one", 3, 3) == [["3"]]
+
+    @pytest.mark.parametrize("start_page,end_page", [(3, 2), (0, 1), (-1, 2)])
+    def test_invalid_range(self, go_calls, start_page, end_page):
+        """Test that empty or out-of-bounds ranges are rejected before calling Go."""
+        with pytest.raises(ValueError):
+            redact.extract_text_positions_range(b"%PDF-1.7 one", start_page, end_page)
+        assert go_calls == []
+
+    def test_empty_pdf(self, go_calls):
+        """Test that empty PDF data is rejected."""
+        with pytest.raises(ValueError):
+            redact.extract_text_positions_range(b"", 1, 1)
+
+
+class TestApplyRedactionsAdvanced:
+    """Tests for the no-op short-circuit of apply_redactions_advanced."""
+
+    @pytest.fixture
+    def go_redactions(self, monkeypatch):
+        """Replace the Go redaction call with a recorder of its options."""
+        calls = []
+
+        def fake_call_pdf_result(func, pdf_data, options_json):
+            calls.append(_json.loads(options_json))
+            return b"%PDF-redacted"
+
+        monkeypatch.setattr(redact, "call_pdf_result", fake_call_pdf_result)
+        monkeypatch.setattr(
+            redact, "_ApplyRedactionsAdvanced", _accessor("ApplyRedactionsAdvanced")
+        )
+        return calls
+
+    @pytest.mark.parametrize(
+        "options", [{}, {"mode": "secure_required"}, {"blocks": [], "textSearch": []}]
+    )
+    def test_no_redactions_returns_input(self, go_redactions, options):
+        """Test that options with nothing to apply skip the Go call."""
+        pdf = b"%PDF-1.7 one"
+
+        assert redact.apply_redactions_advanced(pdf, options) is pdf
+        assert go_redactions == []
+
+    @pytest.mark.parametrize(
+        "options",
+        [
+            {"password": "secret"},
+            {"textSearch": [{"text": "secret"}]},
+            {"mode": "secure_required", "unknownOption": True},
+        ],
+    )
+    def test_other_options_reach_go(self, go_redactions, options):
+        """Test that any option besides mode is passed to Go, known or not."""
+        result = redact.apply_redactions_advanced(b"%PDF-1.7 one", options)
+
+        assert result == b"%PDF-redacted"
+        assert go_redactions == [options]
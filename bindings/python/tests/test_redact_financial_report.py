@@ -15,11 +15,10 @@ def _repo_root() -> Path:
 class TestFinancialReportRedaction:
     """Redaction tests using the sample financial report PDF."""
 
-    def test_financial_report_text_redaction(self):
+    def test_financial_report_text_redaction(self, financial_report_bytes):
         """Redact text and persist output PDF at repository root for inspection."""
         repo_root = _repo_root()
-        pdf_path = repo_root / "sampledata" / "financialreport" / "financial_report.pdf"
-        pdf_bytes = pdf_path.read_bytes()
+        pdf_bytes = financial_report_bytes
 
         out = apply_redactions_advanced(
             pdf_bytes,
@@ -38,13 +37,9 @@ class TestFinancialReportRedaction:
 
         assert out != pdf_bytes
 
-    def test_financial_report_page2_text_redaction(self):
+    def test_financial_report_page2_text_redaction(self, financial_report_bytes):
         """Ensure SECTION C can be located on page 2 for targeted redaction."""
-        repo_root = _repo_root()
-        pdf_path = repo_root / "sampledata" / "financialreport" / "financial_report.pdf"
-        pdf_bytes = pdf_path.read_bytes()
-
-        rects = find_text_occurrences(pdf_bytes, "SECTION C")
+        rects = find_text_occurrences(financial_report_bytes, "SECTION C")
 
         assert len(rects) > 0
         assert any(r.get("pageNum") == 2 for r in rects)
@@ -1,3 +1,4 @@
+import dataclasses
 import json
 
 from pypdfsuit import (
@@ -5,8 +6,10 @@ from pypdfsuit import (
     Cell,
     Config,
     Element,
+    Footer,
     PDFTemplate,
     Row,
+    SecurityConfig,
     SignatureConfig,
     Table,
     Title,
@@ -59,7 +62,7 @@ def test_specialized_serializer_preserves_go_json_keys():
         bookmarks=[Bookmark(title="Root", page=1, dest="root")],
     )
 
-    payload = json.loads(serialize_template(template).decode("utf-8"))
+    payload = json.loads(serialize_template(template))
 
     assert payload["config"]["pageAlignment"] == 1
     assert payload["config"]["pageBorder"] == "0:0:0:0"
@@ -77,3 +80,35 @@ def test_specialized_serializer_preserves_go_json_keys():
     assert cell["textcolor"] == "#000000"
     assert cell["mathEnabled"] is True
     assert "checkbox" not in cell
+
+
+def test_cached_config_dict_tracks_field_updates():
+    security = SecurityConfig(enabled=True, user_password="old")
+
+    first = security.to_dict()
+    first["userPassword"] = "tampered"
+    assert security.to_dict()["userPassword"] == "old"
+    assert "_cached_dict" not in security.to_dict()
+
+    security.user_password = "new"
+    assert security.to_dict()["userPassword"] == "new"
+
+
+def test_cached_config_dict_is_not_a_dataclass_field():
+    footer = Footer(font="Helvetica:10", text="Page")
+    footer.to_dict()
+
+    assert "_cached_dict" not in {f.name for f in dataclasses.fields(footer)}
+    assert "_cached_dict" not in dataclasses.asdict(footer)
+    assert "_cached_dict" not in repr(footer)
+    assert footer == Footer(font="Helvetica:10", text="Page")
+
+
+def test_table_rows_default_to_independent_lists():
+    table = Table(max_columns=1)
+    table.rows.append(Row())
+    table.rows[0].row.append(Cell(props="Helvetica:10", text="A"))
+
+    assert Table(max_columns=1).rows == []
+    assert Row().row == []
+    assert table.to_dict()["rows"] == [{"row": [Cell(props="Helvetica:10", text="A").to_dict()]}]
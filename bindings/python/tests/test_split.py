@@ -2,9 +2,13 @@
 Tests for PDF splitting functionality.
 """
 
+import gc
+from functools import lru_cache
+
 import pytest
 from pypdfsuit import (
     split_pdf,
+    split_pdf_iter,
     parse_page_spec,
     generate_pdf,
     merge_pdfs,
@@ -16,8 +20,9 @@ from pypdfsuit import (
 from pypdfsuit._bindings import GoPDFSuitError
 
 
+@lru_cache(maxsize=64)
 def create_simple_pdf(title: str) -> bytes:
-    """Helper to create a simple PDF for testing."""
+    """Helper to create a simple PDF for testing (cached per title)."""
     template = PDFTemplate(
         config=Config(page="A4", page_alignment=1),
         title=Title(
@@ -29,8 +34,9 @@ def create_simple_pdf(title: str) -> bytes:
     return generate_pdf(template)
 
 
+@lru_cache(maxsize=8)
 def create_multi_page_pdf(num_pages: int) -> bytes:
-    """Helper to create a multi-page PDF by merging single-page PDFs."""
+    """Helper to create a multi-page PDF by merging single-page PDFs (cached)."""
     pdfs = [create_simple_pdf(f"Page {i+1}") for i in range(num_pages)]
     return merge_pdfs(pdfs)
 
@@ -38,40 +44,35 @@ def create_multi_page_pdf(num_pages: int) -> bytes:
 class TestParsePageSpec:
     """Tests for parse_page_spec function."""
 
-    def test_single_page(self):
-        """Test parsing a single page number."""
-        pages = parse_page_spec("1", 10)
-        assert pages == [1]
-
-    def test_multiple_pages(self):
-        """Test parsing multiple page numbers."""
-        pages = parse_page_spec("1,3,5", 10)
-        assert pages == [1, 3, 5]
-
-    def test_page_range(self):
-        """Test parsing a page range."""
-        pages = parse_page_spec("1-3", 10)
-        assert pages == [1, 2, 3]
-
-    def test_mixed_pages_and_ranges(self):
-        """Test parsing mixed pages and ranges."""
-        pages = parse_page_spec("1-3,5,7-9", 10)
-        assert pages == [1, 2, 3, 5, 7, 8, 9]
+    @pytest.mark.parametrize(
+        "spec,total,expected",
+        [
+            ("1", 10, [1]),
+            ("1,3,5", 10, [1, 3, 5]),
+            ("1-3", 10, [1, 2, 3]),
+            ("1-3,5,7-9", 10, [1, 2, 3, 5, 7, 8, 9]),
+        ],
+    )
+    def test_parse(self, spec, total, expected):
+        """Test parsing single pages, lists and ranges."""
+        assert parse_page_spec(spec, total) == expected
 
     def test_empty_spec(self):
         """Test parsing empty spec."""
         pages = parse_page_spec("", 10)
         assert pages is None or pages == []
 
-    def test_invalid_page_number(self):
-        """Test parsing invalid page number."""
-        with pytest.raises(GoPDFSuitError):
-            parse_page_spec("0", 10)
-
-    def test_page_exceeds_total(self):
-        """Test parsing page that exceeds total."""
+    @pytest.mark.parametrize(
+        "spec",
+        [
+            "0",  # page numbers start at 1
+            "15",  # exceeds total
+        ],
+    )
+    def test_invalid_spec(self, spec):
+        """Test parsing invalid page numbers."""
         with pytest.raises(GoPDFSuitError):
-            parse_page_spec("15", 10)
+            parse_page_spec(spec, 10)
 
 
 class TestSplitPDF:
@@ -115,3 +116,40 @@ class TestSplitPDF:
         """Test splitting empty PDF raises error."""
         with pytest.raises(ValueError):
             split_pdf(b"", SplitSpec())
+
+    def test_split_iter_yields_parts(self):
+        """Test iterating over split parts lazily."""
+        pdf = create_multi_page_pdf(5)
+        spec = SplitSpec(max_per_file=2)
+
+        parts = list(split_pdf_iter(pdf, spec))
+
+        assert len(parts) == 3
+        for part in parts:
+            assert part.startswith(b"%PDF-")
+
+    def test_split_iter_frees_unstarted_iterator(self):
+        """Test that dropping an iterator before iterating frees the result."""
+        pdf = create_multi_page_pdf(3)
+        parts = split_pdf_iter(pdf, SplitSpec(max_per_file=1))
+        finalizer = parts._finalizer
+
+        assert finalizer.alive
+        del parts
+        gc.collect()
+        assert not finalizer.alive
+
+    def test_split_iter_close_stops_iteration(self):
+        """Test that closing an iterator frees the result and ends iteration."""
+        pdf = create_multi_page_pdf(3)
+        parts = split_pdf_iter(pdf, SplitSpec(max_per_file=1))
+
+        assert next(parts).startswith(b"%PDF-")
+        parts.close()
+        assert not parts._finalizer.alive
+        assert list(parts) == []
+
+    def test_split_iter_empty_pdf(self):
+        """Test that split_pdf_iter validates input before iteration."""
+        with pytest.raises(ValueError):
+            split_pdf_iter(b"", SplitSpec())
@@ -3,13 +3,45 @@
 Generate Bar Chart and Pie Chart for Annual Financial Report
 """
 
-import matplotlib.pyplot as plt
+# matplotlib is imported inside the functions that draw, so importing this
+# module (or calling only one generator) doesn't pay for pyplot up front.
 import io
 import base64
 import os
+from functools import lru_cache
+
+@lru_cache(maxsize=None)
+def _pyplot():
+    """Import pyplot on the non-interactive Agg backend (PNG output only)
+
+    Cached, so the backend and rcParams are set once, on first use.
+    """
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+
+    plt.rcParams['path.simplify'] = True
+    plt.rcParams['agg.path.chunksize'] = 10000
+    return plt
+
+def save_chart(fig, filename: str) -> str:
+    """Render fig to PNG once, write it to filename and return it as base64"""
+    plt = _pyplot()
+
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format='PNG')
+    plt.close(fig)
+
+    data = buffer.getvalue()
+    with open(filename, 'wb') as f:
+        f.write(data)
+
+    return base64.b64encode(data).decode('utf-8')
 
 def generate_bar_chart(filename: str) -> str:
     """Generate a bar chart and save as PNG, return base64 string"""
+    plt = _pyplot()
+
     # Dummy Data
     quarters = ['Q1', 'Q2', 'Q3', 'Q4']
     revenue = [150000, 180000, 160000, 210000]
@@ -30,22 +62,20 @@ def generate_bar_chart(filename: str) -> str:
     ax.set_xticklabels(quarters)
     ax.legend()
 
+    # Fit the axes labels and title inside the figure; fixed margins can
+    # clip the y-axis tick labels
     fig.tight_layout()
     
-    # Save to file
-    plt.savefig(filename)
+    # Render once; the same PNG bytes go to the file and the base64 string
+    base64_str = save_chart(fig, filename)
     print(f"Bar Chart saved to: {filename}")
     
-    # Convert to base64
-    buffer = io.BytesIO()
-    plt.savefig(buffer, format='PNG')
-    base64_str = base64.b64encode(buffer.getvalue()).decode('utf-8')
-    plt.close()
-    
     return base64_str
 
 def generate_pie_chart(filename: str) -> str:
     """Generate a pie chart and save as PNG, return base64 string"""
+    plt = _pyplot()
+
     # Dummy Data
     labels = ['R&D', 'Marketing', 'Operations', 'Salaries', 'Misc']
     sizes = [25, 20, 15, 35, 5]
@@ -58,16 +88,10 @@ def generate_pie_chart(filename: str) -> str:
     ax1.axis('equal')  # Equal aspect ratio ensures that pie is drawn as a circle.
     plt.title("Annual Expense Breakdown")
 
-    # Save to file
-    plt.savefig(filename)
+    # Render once; the same PNG bytes go to the file and the base64 string
+    base64_str = save_chart(fig1, filename)
     print(f"Pie Chart saved to: {filename}")
     
-    # Convert to base64
-    buffer = io.BytesIO()
-    plt.savefig(buffer, format='PNG')
-    base64_str = base64.b64encode(buffer.getvalue()).decode('utf-8')
-    plt.close()
-    
     return base64_str
 
 def main():
@@ -1,28 +1,29 @@
 
+import re
 import sys
 import numpy as np
 
+THROUGHPUT_RE = re.compile(rb"Throughput:\s*(\S+)")
+LATENCY_RE = re.compile(rb"Avg Latency:\s*(\S+)")
+
+def _values(pattern, data):
+    matches = pattern.findall(data)
+    return np.fromiter(map(float, matches), dtype=np.float64, count=len(matches))
+
 def parse_runs(filename):
-    throughputs = []
-    latencies = []
     try:
-        with open(filename, 'r') as f:
-            for line in f:
-                if "Throughput:" in line:
-                    val = float(line.split(":")[1].strip().split()[0])
-                    throughputs.append(val)
-                if "Avg Latency:" in line:
-                    val = float(line.split(":")[1].strip().split()[0])
-                    latencies.append(val)
+        with open(filename, 'rb') as f:
+            data = f.read()
     except FileNotFoundError:
-        return [], []
-    return throughputs, latencies
+        return np.empty(0), np.empty(0)
+    # Scan the whole log once per metric instead of splitting every line
+    return _values(THROUGHPUT_RE, data), _values(LATENCY_RE, data)
 
 t24, l24 = parse_runs("1.24.txt")
 t26, l26 = parse_runs("1.26.txt")
 
 def print_stats(name, data, unit):
-    if not data:
+    if len(data) == 0:
         print(f"No data for {name}")
         return
     print(f"--- {name} ({unit}) ---")
@@ -4,10 +4,8 @@ Generate QR Code and Barcode for Library Book Receiving Form
 Both codes will encode the URL: www.google.com
 """
 
-import qrcode
-import barcode
-from barcode.writer import ImageWriter
-from PIL import Image
+# qrcode, python-barcode and PIL are imported inside the generators that use
+# them, so importing this module stays cheap.
 import base64
 import io
 import os
@@ -17,34 +15,58 @@ URL = "https://www.google.com"
 
 def generate_qr_code(data: str, filename: str, size: int = 200) -> str:
     """Generate a QR code and save as PNG, return base64 string"""
+    import qrcode
+    from PIL import Image
+
     qr = qrcode.QRCode(
         version=1,
         error_correction=qrcode.constants.ERROR_CORRECT_M,
-        box_size=10,
+        box_size=1,
         border=2,
     )
     qr.add_data(data)
     qr.make(fit=True)
     
-    img = qr.make_image(fill_color="black", back_color="white")
-    
-    # Resize to desired size
-    img = img.resize((size, size), Image.Resampling.LANCZOS)
+    # Draw the module matrix (border included) as a 1-pixel-per-module
+    # grayscale image, then block-expand it with a single nearest-neighbour
+    # resize. This skips qrcode's image factory and never materializes a
+    # larger image than the output. The scale is a whole number of pixels
+    # per module so every module has the same width; any remainder up to
+    # the requested size is white padding around the code.
+    matrix = qr.get_matrix()
+    modules = len(matrix)
+    pixels = bytes(0 if dark else 255 for row in matrix for dark in row)
+    img = Image.frombytes('L', (modules, modules), pixels)
+    scaled = modules * max(1, size // modules)
+    img = img.resize((scaled, scaled), Image.Resampling.NEAREST)
+    if scaled < size:
+        padded = Image.new('L', (size, size), 255)
+        offset = (size - scaled) // 2
+        padded.paste(img, (offset, offset))
+        img = padded
+    
+    # Encode once; the same PNG bytes go to the file and the base64 string
+    buffer = io.BytesIO()
+    img.save(buffer, format='PNG')
+    png_bytes = buffer.getvalue()
     
     # Save to file
-    img.save(filename)
+    with open(filename, 'wb') as f:
+        f.write(png_bytes)
     print(f"QR Code saved to: {filename}")
     
     # Convert to base64
-    buffer = io.BytesIO()
-    img.save(buffer, format='PNG')
-    base64_str = base64.b64encode(buffer.getvalue()).decode('utf-8')
+    base64_str = base64.b64encode(png_bytes).decode('utf-8')
     
     return base64_str
 
 
 def generate_barcode(data: str, filename: str) -> str:
     """Generate a Code128 barcode and save as PNG, return base64 string"""
+    import barcode
+    from barcode.writer import ImageWriter
+    from PIL import Image
+
     # Use Code128 which can encode URLs
     code128 = barcode.get_barcode_class('code128')
     
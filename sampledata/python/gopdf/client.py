@@ -1,46 +1,74 @@
-import json
 import logging
 from pathlib import Path
-from typing import Union, Optional
+from typing import BinaryIO, Union, Optional
 import requests
+from requests.adapters import HTTPAdapter
 from .models import PdfRequest
 
 class PdfClient:
+    # Fixed per-instance state; no __dict__ for each client (e.g. per worker)
+    __slots__ = ("api_url", "_session")
+
+    _JSON_HEADERS = {"Content-Type": "application/json"}
+    # One module logger shared by every client
+    logger = logging.getLogger(__name__)
+
     def __init__(self, api_url: str = "http://localhost:8080/api/v1/generate/template-pdf"):
         self.api_url = api_url
-        self.logger = logging.getLogger(__name__)
+        # Reuse connections (HTTP keep-alive) across generate_pdf calls
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
 
-    def generate_pdf(self, request_data: Union[PdfRequest, dict]) -> Optional[bytes]:
+    def generate_pdf(
+        self,
+        request_data: Union[PdfRequest, dict],
+        dest: Optional[BinaryIO] = None,
+    ) -> Union[bytes, int, None]:
         """
         Sends a PDF generation request to the API.
         
         Args:
             request_data: PdfRequest model instance or dictionary data
+            dest: Optional binary file object. When given, the PDF is streamed
+                into it in chunks instead of being held in memory.
             
         Returns:
-            bytes: The PDF content if successful, None otherwise
+            bytes: The PDF content if successful (no dest), None otherwise
+            int: The number of bytes written to dest if successful
         """
         # Validate and convert if it's a dict
         if isinstance(request_data, dict):
             try:
-                request_data = PdfRequest(**request_data)
+                request_data = PdfRequest.model_validate(request_data)
             except Exception as e:
                 self.logger.error(f"Validation Error: {e}")
                 return None
 
-        payload = request_data.model_dump(mode='json')
+        # Serialize straight to JSON in pydantic-core, no intermediate dict
+        body = request_data.model_dump_json().encode("utf-8")
 
         self.logger.info(f"Sending request to {self.api_url}...")
         try:
-            response = requests.post(self.api_url, json=payload)
-            
-            if response.status_code == 200:
-                self.logger.info("PDF generated successfully.")
-                return response.content
-            else:
-                self.logger.error(f"Request failed with status code: {response.status_code}")
-                self.logger.error(f"Response: {response.text}")
-                return None
+            with self._session.post(
+                self.api_url,
+                data=body,
+                headers=self._JSON_HEADERS,
+                stream=dest is not None,
+            ) as response:
+                if response.status_code == 200:
+                    self.logger.info("PDF generated successfully.")
+                    if dest is None:
+                        return response.content
+                    written = 0
+                    for chunk in response.iter_content(chunk_size=64 * 1024):
+                        written += dest.write(chunk)
+                    return written
+                else:
+                    self.logger.error(f"Request failed with status code: {response.status_code}")
+                    self.logger.error(f"Response: {response.text}")
+                    return None
                 
         except requests.RequestException as e:
             self.logger.error(f"Connection Error: {e}")
@@ -51,9 +79,15 @@ class PdfClient:
         Loads JSON from a file and generates a PDF.
         """
         try:
-            with open(json_path, "r") as f:
-                data = json.load(f)
-            return self.generate_pdf(data)
+            raw = Path(json_path).read_bytes()
         except Exception as e:
             self.logger.error(f"Error reading file {json_path}: {e}")
             return None
+
+        # Validate from the raw bytes; pydantic parses the JSON itself
+        try:
+            request_data = PdfRequest.model_validate_json(raw)
+        except Exception as e:
+            self.logger.error(f"Validation Error: {e}")
+            return None
+        return self.generate_pdf(request_data)
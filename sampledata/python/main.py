@@ -1,6 +1,7 @@
 # This is a sample Python script to generate a PDF from a JSON template using the GoPDFSuit API.
 # It demonstrates how to fill a template with user data and generate a PDF.
 
+import functools
 import logging
 import json
 import re
@@ -8,31 +9,70 @@ from pathlib import Path
 import time
 from gopdf import PdfClient
 
+# orjson parses templates several times faster when it's installed; the
+# stdlib parser accepts the same bytes input
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
 
+# {identifier} placeholders, compiled once for every string in the template
+_PLACEHOLDER_RE = re.compile(r'\{(\w+)\}')
+
 def fill_template(template, data):
     """
-    Recursively traverse the template (dict/list/str) and replace {key} placeholders
+    Traverse the template (dict/list/str) and replace {key} placeholders
     with values from the data dictionary.
+
+    Uses an explicit stack instead of recursion, so deeply nested templates
+    cost no Python frame per node and can't hit the recursion limit.
     """
-    if isinstance(template, dict):
-        return {k: fill_template(v, data) for k, v in template.items()}
-    elif isinstance(template, list):
-        return [fill_template(i, data) for i in template]
-    elif isinstance(template, str):
-        # Replace occurrences of {key} with data[key]
-        # We use a regex to find all {identifier} patterns
-        def replace_match(match):
-            key = match.group(1)
-            # Return the value from data if found, otherwise keep the placeholder
-            # Convert non-string values to string
-            return str(data.get(key, match.group(0)))
-        
-        return re.sub(r'\{(\w+)\}', replace_match, template)
-    else:
+    # Convert non-string values to string once, up front, so each match is a
+    # single dict lookup
+    get = {k: str(v) for k, v in data.items()}.get
+    sub = _PLACEHOLDER_RE.sub
+
+    def replace(match):
+        # Return the value from data if found, otherwise keep the placeholder
+        return get(match.group(1), match.group(0))
+
+    def shell(node):
+        # Empty container of the same kind, filled in as the stack drains
+        return {} if type(node) is dict else [None] * len(node)
+
+    if type(template) is not dict and type(template) is not list:
+        if type(template) is str and '{' in template:
+            return sub(replace, template)
         return template
 
+    result = shell(template)
+    stack = [(template, result)]
+    while stack:
+        src, dst = stack.pop()
+        items = src.items() if type(src) is dict else enumerate(src)
+        for key, value in items:
+            if type(value) is dict or type(value) is list:
+                child = dst[key] = shell(value)
+                stack.append((value, child))
+            elif type(value) is str and '{' in value:
+                dst[key] = sub(replace, value)
+            else:
+                dst[key] = value
+    return result
+
+@functools.lru_cache(maxsize=8)
+def _load_template(path, mtime):
+    """
+    Parse a template file, cached per (path, mtime) so repeated main() calls
+    skip the read and JSON parse until the file changes. Callers must not
+    mutate the result; fill_template builds a new tree and leaves it intact.
+    """
+    with open(path, "rb") as f:
+        return json_loads(f.read())
+
 def main():
     # Configuration
     BASE_DIR = Path(__file__).parent
@@ -75,8 +115,7 @@ def main():
     # 2. Load Template
     logging.info(f"Loading template from {TEMPLATE_FILE}...")
     try:
-        with open(TEMPLATE_FILE, "r") as f:
-            template_data = json.load(f)
+        template_data = _load_template(str(TEMPLATE_FILE), TEMPLATE_FILE.stat().st_mtime_ns)
     except Exception as e:
         logging.error(f"Error loading template: {e}")
         return
@@ -93,37 +132,33 @@ def main():
         tables = filled_data.pop("table")
         
         # If 'elements' exists and has indices, map them. Otherwise just map all tables in order.
-        new_elements = []
         if "elements" in filled_data:
-            for el in filled_data["elements"]:
-                if el.get("type") == "table" and "index" in el:
-                    idx = el["index"]
-                    if 0 <= idx < len(tables):
-                        new_elements.append({
-                            "type": "table",
-                            "table": tables[idx]
-                        })
+            num_tables = len(tables)
+            filled_data["elements"] = [
+                {"type": "table", "table": tables[el["index"]]}
+                for el in filled_data["elements"]
+                if el.get("type") == "table" and "index" in el and 0 <= el["index"] < num_tables
+            ]
         else:
             # Fallback: just add all tables in order if no elements map exists
-            for tbl in tables:
-                new_elements.append({
-                    "type": "table",
-                    "table": tbl
-                })
-        
-        filled_data["elements"] = new_elements
+            filled_data["elements"] = [{"type": "table", "table": tbl} for tbl in tables]
 
     # 4. Generate PDF
     client = PdfClient()
     logging.info(f"Sending request to generate PDF...")
-    pdf_content = client.generate_pdf(filled_data)
+    # Stream the response to disk in chunks (never holding the whole PDF in
+    # memory). Write to a side file and move it into place only on success,
+    # so a failed request doesn't leave OUTPUT_FILE truncated.
+    partial_file = OUTPUT_FILE.with_name(OUTPUT_FILE.name + ".part")
+    with open(partial_file, "wb") as f:
+        written = client.generate_pdf(filled_data, dest=f)
     
-    if pdf_content:
-        logging.info(f"Success! Saving PDF to {OUTPUT_FILE}...")
-        with open(OUTPUT_FILE, "wb") as f:
-            f.write(pdf_content)
+    if written:
+        partial_file.replace(OUTPUT_FILE)
+        logging.info(f"Success! Saved {written} bytes to {OUTPUT_FILE}.")
         logging.info("Done.")
     else:
+        partial_file.unlink(missing_ok=True)
         logging.error("Failed to generate PDF.")
 
 if __name__ == "__main__":
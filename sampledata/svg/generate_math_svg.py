@@ -1,7 +1,26 @@
 import random
-import matplotlib.pyplot as plt
 import os
 
+# Only the mathtext/text-to-path layer of matplotlib is used: no pyplot, no
+# figure or backend setup, which is most of matplotlib's startup cost.
+from matplotlib.font_manager import FontProperties
+from matplotlib.path import Path
+from matplotlib.textpath import TextPath
+from matplotlib.transforms import Affine2D
+
+FONT_SIZE = 28  # points
+PAD = 0.2 * 72  # 0.2 inch of padding, in points (SVG user units)
+
+# Shared by every save_math_svg call; TextPath only reads it
+_FONT = FontProperties()
+
+_SVG_COMMANDS = {
+    Path.MOVETO: "M",
+    Path.LINETO: "L",
+    Path.CURVE3: "Q",
+    Path.CURVE4: "C",
+}
+
 def generate_complex_calculus():
     """Generates a long and complex calculus formula involving integration and differentiation."""
     
@@ -56,26 +75,45 @@ def generate_derivative_chain_problem():
     )
     return formula
 
+def _svg_path_data(path):
+    """Converts a matplotlib Path to SVG path data."""
+    parts = []
+    for vertices, code in path.iter_segments(simplify=False, curves=True):
+        if code == Path.CLOSEPOLY:
+            parts.append("Z")
+        else:
+            coords = " ".join(f"{v:.3f}" for v in vertices)
+            parts.append(f"{_SVG_COMMANDS[code]} {coords}")
+    return " ".join(parts)
+
 def save_math_svg(math_text, filename="problem.svg"):
     """Renders LaTeX math text to an SVG file."""
-    # Use Matplotlib's mathtext engine for standard math rendering
-    plt.rcParams.update({
-        "text.usetex": False,
-        "svg.fonttype": "path", # Important for portability
-        "figure.facecolor": "none",
-        "axes.facecolor": "none",
-    })
+    # Use Matplotlib's mathtext engine for standard math rendering; glyphs
+    # come out as outlines, so the SVG is portable without fonts
+    path = TextPath((0, 0), math_text, size=FONT_SIZE, prop=_FONT)
 
-    # Create figure with dynamic size based on text length (rough estimation)
-    # The font size is 32, so we adjust the figure size to avoid clipping
-    fig = plt.figure(figsize=(12, 3))
-    
-    # Add text to the figure. 
-    fig.text(0.5, 0.5, math_text, fontsize=28, ha='center', va='center')
+    # Fit the canvas tightly around the outlines plus padding, and flip y:
+    # text paths are y-up, SVG is y-down
+    extents = path.get_extents()
+    width = extents.width + 2 * PAD
+    height = extents.height + 2 * PAD
+    to_svg = (
+        Affine2D()
+        .translate(PAD - extents.x0, -PAD - extents.y1)
+        .scale(1, -1)
+    )
+    path_data = _svg_path_data(to_svg.transform_path(path))
 
-    # Save as SVG. 
-    plt.savefig(filename, format='svg', bbox_inches='tight', pad_inches=0.2, transparent=True)
-    plt.close(fig)
+    # Transparent background: only the glyph outlines are drawn
+    svg = (
+        '<?xml version="1.0" encoding="utf-8" standalone="no"?>\n'
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width:.2f}pt" height="{height:.2f}pt" '
+        f'viewBox="0 0 {width:.2f} {height:.2f}" version="1.1">\n'
+        f'  <path d="{path_data}" fill="#000000"/>\n'
+        '</svg>\n'
+    )
+    with open(filename, "w", encoding="utf-8") as f:
+        f.write(svg)
     print(f"Successfully generated complex math SVG: {filename}")
     print(f"Mathematical expression: {math_text}")
 